@@ -20,7 +20,6 @@ from render.markdown_live import MarkdownStyled
 
 # Import core components from llm-cli.py
 from providers import get_provider
-from util.simple_pt_input import get_multiline_input
 from util.command_helpers import handle_special_commands
 from util.input_helpers import should_exit_from_input
 from chat.session import ChatSession
@@ -51,7 +50,7 @@ def get_agent_input(console, prompt_style, display_string, thinking_mode, user_h
     Removes /tools indicator since function calling is always enabled for the agent.
     """
     # Import the internal functions we need
-    from util.simple_pt_input import _create_key_bindings, _prompt_for_input, _process_user_input
+    from util.simple_pt_input import InputResult, _create_key_bindings, _noop_result, _prompt_for_input
 
     # Custom display function for Rails agent (no /tools indicator)
     def _display_rails_instructions(token_info: str = None, thinking_mode: bool = False) -> None:
@@ -84,23 +83,23 @@ def get_agent_input(console, prompt_style, display_string, thinking_mode, user_h
         user_input = _prompt_for_input(key_bindings, user_history, None)
 
         if not user_input:
-            return None, False, thinking_mode, tools_enabled
+            return _noop_result(thinking_mode, tools_enabled)
 
         # Handle thinking toggle
         if user_input.strip().lower() == "/think":
             thinking_mode = not thinking_mode
-            return None, True, thinking_mode, tools_enabled
+            return InputResult(None, True, thinking_mode, tools_enabled)
 
         # Ignore /tools command since tools are always enabled
         if user_input.strip().lower() == "/tools":
             console.print("[dim]Tools are always enabled for Rails analysis[/dim]")
-            return None, False, thinking_mode, tools_enabled
+            return _noop_result(thinking_mode, tools_enabled)
 
-        return user_input, False, thinking_mode, tools_enabled
+        return InputResult(user_input, False, thinking_mode, tools_enabled)
 
     except Exception as e:
         console.print(f"[red]Input error: {e}[/red]")
-        return None, False, thinking_mode, tools_enabled
+        return _noop_result(thinking_mode, tools_enabled)
 
 
 def repl(
@@ -187,7 +186,7 @@ def repl(
             display_string = f"{usage_display} • Rails Code Analysis • {project_name} • {rag_status}"
 
             # Get user input synchronously
-            user_input, use_thinking, thinking_mode, tools_enabled = get_agent_input(
+            turn = get_agent_input(
                 console,
                 PROMPT_STYLE,
                 display_string,
@@ -195,6 +194,9 @@ def repl(
                 user_history,
                 tools_enabled,
             )
+            user_input = turn.text
+            thinking_mode = turn.thinking_mode
+            tools_enabled = turn.tools_enabled
 
             # Handle exit conditions
             if should_exit_from_input(user_input):
@@ -24,6 +24,9 @@ from agents.tools.route_analyzer import RouteAnalyzer
 from agents.tools.migration_analyzer import MigrationAnalyzer
 from agents.prompts.system_prompt import RAILS_REACT_SYSTEM_PROMPT
 
+# Shared decoder for pulling tool-input objects out of free-form LLM text
+_JSON_DECODER = json.JSONDecoder()
+
 
 @dataclass
 class ReActStep:
@@ -741,23 +744,19 @@ Input: {"pattern": "SELECT|WHERE|FROM", "file_types": ["rb", "erb"]}
         ]
 
     def _extract_json_after(self, text: str, start_idx: int) -> Optional[Dict[str, Any]]:
-        import json as _json
+        """Decode the first JSON object starting at or after start_idx.
+
+        raw_decode stops at the end of that object, so trailing prose is
+        ignored and braces inside string values don't confuse the match.
+        """
         brace_idx = text.find('{', start_idx)
         if brace_idx == -1:
             return None
-        depth = 0
-        for i in range(brace_idx, len(text)):
-            ch = text[i]
-            if ch == '{':
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return _json.loads(text[brace_idx:i+1])
-                    except Exception:
-                        return None
-        return None
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, brace_idx)
+        except ValueError:
+            return None
+        return obj
 
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
         """
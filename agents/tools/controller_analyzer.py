@@ -9,6 +9,13 @@ from typing import Any, Dict, List, Optional
 
 from .base_tool import BaseTool
 
+# before/after/around _action and the older _filter forms
+_FILTER_PATTERNS = (
+    re.compile(r'(before_action|after_action|around_action)\s+:(\w+)'),
+    re.compile(r'(before_filter|after_filter|around_filter)\s+:(\w+)'),
+)
+_METHOD_RE = re.compile(r'def\s+(\w+)')
+
 
 class ControllerAnalyzer(BaseTool):
     """Tool for analyzing Rails controller files."""
@@ -171,13 +178,12 @@ class ControllerAnalyzer(BaseTool):
 
     def _extract_filter(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract filter from line."""
-        filter_patterns = [
-            r'(before_action|after_action|around_action)\s+:(\w+)',
-            r'(before_filter|after_filter|around_filter)\s+:(\w+)'
-        ]
+        # Cheap literal check first: both patterns need one of these substrings
+        if "_action" not in line and "_filter" not in line:
+            return None
 
-        for pattern in filter_patterns:
-            match = re.search(pattern, line)
+        for pattern in _FILTER_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -189,8 +195,10 @@ class ControllerAnalyzer(BaseTool):
 
     def _extract_method(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract method definition from line."""
-        method_pattern = r'def\s+(\w+)'
-        match = re.search(method_pattern, line)
+        if "def" not in line:
+            return None
+
+        match = _METHOD_RE.search(line)
 
         if match:
             method_name = match.group(1)
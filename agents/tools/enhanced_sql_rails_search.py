@@ -15,7 +15,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from util.rails_naming import table_to_model
+
 from .base_tool import BaseTool
+from .ripgrep_tool import RG_MAX_COLUMNS, rg_type_args
 from .semantic_sql_analyzer import (
     SemanticSQLAnalyzer,
     QueryAnalysis,
@@ -1010,8 +1013,8 @@ class EnhancedSQLRailsSearch(BaseTool):
 
         cmd = [
             "rg", "--line-number", "--with-filename", "-i",
-            "--type-add", f"target:*.{file_ext}",
-            "--type", "target",
+            "--max-columns", str(RG_MAX_COLUMNS), "--max-columns-preview",
+            *rg_type_args([file_ext]),
             pattern,
             self.project_root
         ]
@@ -1107,20 +1110,7 @@ class EnhancedSQLRailsSearch(BaseTool):
 
     def _table_to_model(self, table: str) -> str:
         """Convert table name to Rails model name."""
-        # Basic singularization and capitalization
-        table = table.lower()
-        if table.endswith("ies"):
-            singular = table[:-3] + "y"
-        elif table.endswith("ses"):
-            singular = table[:-2]
-        elif table.endswith("es") and not table.endswith("oses"):
-            singular = table[:-2]
-        elif table.endswith("s"):
-            singular = table[:-1]
-        else:
-            singular = table
-
-        return "".join(word.capitalize() for word in singular.split("_"))
+        return table_to_model(table)
 
     def _rel_path(self, file_path: str) -> str:
         """Convert absolute path to relative path."""
@@ -9,6 +9,28 @@ from typing import Any, Dict, List, Optional
 
 from .base_tool import BaseTool
 
+# Every operation in one alternation, so each line costs a single search. Name
+# arguments may be :sym, "str" or 'str'. The outer named group of the branch
+# that matched is ``lastgroup`` and names the operation type.
+_OPERATION_RE = re.compile(
+    r"""(?P<create_table>create_table\s+[:'"](?P<ct_table>\w+)['"]*)"""
+    r"""|(?P<drop_table>drop_table\s+[:'"](?P<dt_table>\w+)['"]*)"""
+    r"""|(?P<add_column>add_column\s+[:'"](?P<ac_table>\w+)['"]*,\s*[:'"](?P<ac_column>\w+)['"]*,\s*:(?P<ac_type>\w+))"""
+    r"""|(?P<remove_column>remove_column\s+[:'"](?P<rc_table>\w+)['"]*,\s*[:'"](?P<rc_column>\w+)['"]*)"""
+    r"""|(?P<add_index>add_index\s+[:'"](?P<ai_table>\w+)['"]*,\s*[:'"](?P<ai_column>\w+)['"]*)"""
+    r"""|(?P<change_column>change_column\s+[:'"](?P<cc_table>\w+)['"]*,\s*[:'"](?P<cc_column>\w+)['"]*,\s*:(?P<cc_type>\w+))"""
+)
+
+# Result field -> capture group, per operation type (in output order)
+_OPERATION_FIELDS = {
+    "create_table": (("table", "ct_table"),),
+    "drop_table": (("table", "dt_table"),),
+    "add_column": (("table", "ac_table"), ("column", "ac_column"), ("column_type", "ac_type")),
+    "remove_column": (("table", "rc_table"), ("column", "rc_column")),
+    "add_index": (("table", "ai_table"), ("column", "ai_column")),
+    "change_column": (("table", "cc_table"), ("column", "cc_column"), ("new_type", "cc_type")),
+}
+
 
 class MigrationAnalyzer(BaseTool):
     """Tool for analyzing Rails database migrations."""
@@ -155,74 +177,16 @@ class MigrationAnalyzer(BaseTool):
 
     def _extract_migration_operation(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract migration operation from line."""
-
-        # Create table
-        create_match = re.search(r'create_table\s+[:\'""](\w+)[\'""]*', line)
-        if create_match:
-            return {
-                "line": line_number,
-                "type": "create_table",
-                "table": create_match.group(1),
-                "content": line
-            }
-
-        # Drop table
-        drop_match = re.search(r'drop_table\s+[:\'""](\w+)[\'""]*', line)
-        if drop_match:
-            return {
-                "line": line_number,
-                "type": "drop_table",
-                "table": drop_match.group(1),
-                "content": line
-            }
-
-        # Add column
-        add_column_match = re.search(r'add_column\s+[:\'""](\w+)[\'""]*,\s*[:\'""](\w+)[\'""]*,\s*:(\w+)', line)
-        if add_column_match:
-            return {
-                "line": line_number,
-                "type": "add_column",
-                "table": add_column_match.group(1),
-                "column": add_column_match.group(2),
-                "column_type": add_column_match.group(3),
-                "content": line
-            }
-
-        # Remove column
-        remove_column_match = re.search(r'remove_column\s+[:\'""](\w+)[\'""]*,\s*[:\'""](\w+)[\'""]*', line)
-        if remove_column_match:
-            return {
-                "line": line_number,
-                "type": "remove_column",
-                "table": remove_column_match.group(1),
-                "column": remove_column_match.group(2),
-                "content": line
-            }
-
-        # Add index
-        add_index_match = re.search(r'add_index\s+[:\'""](\w+)[\'""]*,\s*[:\'""](\w+)[\'""]*', line)
-        if add_index_match:
-            return {
-                "line": line_number,
-                "type": "add_index",
-                "table": add_index_match.group(1),
-                "column": add_index_match.group(2),
-                "content": line
-            }
-
-        # Change column
-        change_column_match = re.search(r'change_column\s+[:\'""](\w+)[\'""]*,\s*[:\'""](\w+)[\'""]*,\s*:(\w+)', line)
-        if change_column_match:
-            return {
-                "line": line_number,
-                "type": "change_column",
-                "table": change_column_match.group(1),
-                "column": change_column_match.group(2),
-                "new_type": change_column_match.group(3),
-                "content": line
-            }
-
-        return None
+        match = _OPERATION_RE.search(line)
+        if not match:
+            return None
+
+        op_type = match.lastgroup
+        operation = {"line": line_number, "type": op_type}
+        for field, group in _OPERATION_FIELDS[op_type]:
+            operation[field] = match.group(group)
+        operation["content"] = line
+        return operation
 
     def _summarize_table_operations(self, migrations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Summarize operations by table."""
@@ -9,6 +9,22 @@ from typing import Any, Dict, List, Optional
 
 from .base_tool import BaseTool
 
+# validates :attr, ... / validate :custom_method
+_VALIDATION_PATTERNS = (
+    re.compile(r'validates?\s+([^,]+)'),
+    re.compile(r'validate\s+:(\w+)'),
+)
+# belongs_to / has_one / has_many / has_and_belongs_to_many :name
+_ASSOCIATION_PATTERNS = (
+    re.compile(r'(belongs_to|has_one|has_many|has_and_belongs_to_many)\s+:(\w+)'),
+)
+# before_/after_/around_<event> :method (or a block/lambda)
+_CALLBACK_PATTERNS = (
+    re.compile(r'(before_|after_|around_)(\w+)\s+:(\w+)'),
+    re.compile(r'(before_|after_|around_)(\w+)\s+(.+)'),
+)
+_METHOD_RE = re.compile(r'def\s+(\w+)')
+
 
 class ModelAnalyzer(BaseTool):
     """Tool for analyzing Rails model files."""
@@ -142,13 +158,11 @@ class ModelAnalyzer(BaseTool):
 
     def _extract_validation(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract validation from line."""
-        validation_patterns = [
-            r'validates?\s+([^,]+)',
-            r'validate\s+:(\w+)'
-        ]
+        if "validate" not in line:
+            return None
 
-        for pattern in validation_patterns:
-            match = re.search(pattern, line)
+        for pattern in _VALIDATION_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -160,12 +174,12 @@ class ModelAnalyzer(BaseTool):
 
     def _extract_association(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract association from line."""
-        association_patterns = [
-            r'(belongs_to|has_one|has_many|has_and_belongs_to_many)\s+:(\w+)',
-        ]
+        # has_and_belongs_to_many is covered by "belongs_to"
+        if "belongs_to" not in line and "has_one" not in line and "has_many" not in line:
+            return None
 
-        for pattern in association_patterns:
-            match = re.search(pattern, line)
+        for pattern in _ASSOCIATION_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -177,13 +191,12 @@ class ModelAnalyzer(BaseTool):
 
     def _extract_callback(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract callback from line."""
-        callback_patterns = [
-            r'(before_|after_|around_)(\w+)\s+:(\w+)',
-            r'(before_|after_|around_)(\w+)\s+(.+)'
-        ]
+        # Both patterns need one of the timing prefixes; most lines have none
+        if "before_" not in line and "after_" not in line and "around_" not in line:
+            return None
 
-        for pattern in callback_patterns:
-            match = re.search(pattern, line)
+        for pattern in _CALLBACK_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -196,8 +209,10 @@ class ModelAnalyzer(BaseTool):
 
     def _extract_method(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract method definition from line."""
-        method_pattern = r'def\s+(\w+)'
-        match = re.search(method_pattern, line)
+        if "def" not in line:
+            return None
+
+        match = _METHOD_RE.search(line)
 
         if match:
             method_name = match.group(1)
@@ -4,11 +4,35 @@ Ripgrep tool for fast text search in Rails projects.
 from __future__ import annotations
 
 import subprocess
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base_tool import BaseTool
 
+# Longest line rg prints in full; longer ones (minified assets, generated
+# fixtures) are shown as a preview instead of dumped into the tool output
+RG_MAX_COLUMNS = 200
+
+
+def rg_type_args(file_types: List[str]) -> List[str]:
+    """
+    Build rg file-type filter arguments for extensions like 'rb' or '*.erb'.
+
+    Ruby uses rg's built-in ``ruby`` type (precompiled, also covers Gemfile,
+    Rakefile, *.gemspec); anything else becomes a ``*.ext`` glob on an ad-hoc
+    type.
+    """
+    args: List[str] = []
+    for file_type in file_types:
+        ext = file_type.lstrip("*").lstrip(".")
+        if ext == "rb":
+            args.extend(["--type", "ruby"])
+        else:
+            args.extend(["--type-add", f"target:*.{ext}", "--type", "target"])
+    return args
+
 
 class RipgrepTool(BaseTool):
     """Tool for fast text search using ripgrep."""
@@ -82,7 +106,10 @@ class RipgrepTool(BaseTool):
 
         try:
             # Build ripgrep command
-            cmd = ["rg", "--line-number", "--with-filename"]
+            cmd = [
+                "rg", "--line-number", "--with-filename",
+                "--max-columns", str(RG_MAX_COLUMNS), "--max-columns-preview",
+            ]
 
             # Case-insensitive by default to avoid false negatives on Rails conventions
             if case_insensitive:
@@ -93,28 +120,22 @@ class RipgrepTool(BaseTool):
                 cmd.extend(["-C", str(context)])
 
             # Add file type filters
-            for file_type in file_types:
-                cmd.extend(["--type-add", f"target:{file_type}", "--type", "target"])
+            cmd.extend(rg_type_args(file_types))
 
             # Add pattern and search path
             cmd.extend([pattern, self.project_root])
 
-            # Execute ripgrep
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Execute ripgrep, reading only the lines we will parse
+            returncode, head, stderr = self._run_head(cmd, max_results, timeout=10)
 
-            if result.returncode != 0:
-                if result.returncode == 1:  # No matches found
+            if returncode != 0:
+                if returncode == 1:  # No matches found
                     return {"matches": [], "total": 0, "message": "No matches found"}
                 else:
-                    return f"Ripgrep error: {result.stderr}"
+                    return f"Ripgrep error: {stderr}"
 
             # Parse results
-            matches = self._parse_ripgrep_output(result.stdout, max_results)
+            matches = self._parse_ripgrep_output("\n".join(head), max_results)
 
             return {
                 "matches": matches,
@@ -129,6 +150,53 @@ class RipgrepTool(BaseTool):
         except Exception as e:
             return f"Error executing ripgrep: {e}"
 
+    def _run_head(self, cmd: List[str], max_lines: int, timeout: float) -> Tuple[int, List[str], str]:
+        """
+        Run cmd and read at most max_lines lines of its stdout.
+
+        Once enough lines have arrived the process is killed rather than left
+        to produce (and buffer) output that would be thrown away; that case
+        reports returncode 0.
+
+        Returns:
+            (returncode, stdout lines, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: if the process runs past timeout
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+        # Drain stderr concurrently so a full stderr pipe can't stall stdout
+        stderr_chunks: List[str] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+
+        timed_out = threading.Event()
+
+        def _on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _on_timeout)
+        timer.start()
+        try:
+            head = [line.rstrip('\n') for line in islice(proc.stdout, max_lines)]
+            if len(head) == max_lines:
+                proc.kill()
+                returncode = 0
+            else:
+                returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            proc.wait()
+            stderr_reader.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return returncode, head, "".join(stderr_chunks)
+
     def _parse_ripgrep_output(self, output: str, max_results: int) -> List[Dict[str, Any]]:
         """
         Parse ripgrep output into structured results.
@@ -9,6 +9,22 @@ from typing import Any, Dict, List, Optional
 
 from .base_tool import BaseTool
 
+# resource(s) :name or resource(s) "name"
+_RESOURCE_PATTERNS = (
+    re.compile(r'resources?\s+:(\\w+)'),
+    re.compile(r'resources?\s+["\'](\w+)["\']'),
+)
+# namespace :name or namespace "name"
+_NAMESPACE_PATTERNS = (
+    re.compile(r'namespace\s+:(\\w+)'),
+    re.compile(r'namespace\s+["\'](\w+)["\']'),
+)
+# get/post/put/patch/delete/match "path" => "controller#action"
+_CUSTOM_ROUTE_PATTERNS = (
+    re.compile(r'(get|post|put|patch|delete)\s+["\']([^"\']+)["\'].*=>\s*["\']?([^"\'\\s,]+)'),
+    re.compile(r'(match)\s+["\']([^"\']+)["\'].*=>\s*["\']?([^"\'\\s,]+)'),
+)
+
 
 class RouteAnalyzer(BaseTool):
     """Tool for analyzing Rails routes and routing configuration."""
@@ -131,13 +147,12 @@ class RouteAnalyzer(BaseTool):
 
     def _extract_resource(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract resource route from line."""
-        resource_patterns = [
-            r'resources?\s+:(\\w+)',
-            r'resources?\s+["\'](\w+)["\']'
-        ]
+        # Literal check first; most route lines aren't resource declarations
+        if "resource" not in line:
+            return None
 
-        for pattern in resource_patterns:
-            match = re.search(pattern, line)
+        for pattern in _RESOURCE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 resource_name = match.group(1)
                 route_type = "resources" if line.strip().startswith("resources") else "resource"
@@ -153,13 +168,11 @@ class RouteAnalyzer(BaseTool):
 
     def _extract_namespace(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract namespace from line."""
-        namespace_patterns = [
-            r'namespace\s+:(\\w+)',
-            r'namespace\s+["\'](\w+)["\']'
-        ]
+        if "namespace" not in line:
+            return None
 
-        for pattern in namespace_patterns:
-            match = re.search(pattern, line)
+        for pattern in _NAMESPACE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -170,13 +183,12 @@ class RouteAnalyzer(BaseTool):
 
     def _extract_custom_route(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
         """Extract custom route from line."""
-        custom_patterns = [
-            r'(get|post|put|patch|delete)\s+["\']([^"\']+)["\'].*=>\s*["\']?([^"\'\\s,]+)',
-            r'(match)\s+["\']([^"\']+)["\'].*=>\s*["\']?([^"\'\\s,]+)'
-        ]
+        # Both patterns need a hash rocket; skip the backtracking .* otherwise
+        if "=>" not in line:
+            return None
 
-        for pattern in custom_patterns:
-            match = re.search(pattern, line)
+        for pattern in _CUSTOM_ROUTE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return {
                     "line": line_number,
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from util.rails_naming import table_to_model
+
 
 class QueryIntent(Enum):
     """Semantic intent of SQL queries."""
@@ -40,23 +42,7 @@ class TableReference:
     def _table_to_model(self, table: str) -> str:
         """Convert table name to Rails model name using proper pluralization."""
         # Remove any schema prefix
-        table = table.split('.')[-1]
-        table = table.lower()
-
-        # Basic pluralization rules
-        if table.endswith("ies"):
-            singular = table[:-3] + "y"
-        elif table.endswith("ses"):
-            singular = table[:-2]
-        elif table.endswith("es") and not table.endswith("oses"):
-            singular = table[:-2]
-        elif table.endswith("s"):
-            singular = table[:-1]
-        else:
-            singular = table
-
-        # Convert to CamelCase
-        return "".join(word.capitalize() for word in singular.split("_"))
+        return table_to_model(table.split('.')[-1])
 
 
 @dataclass
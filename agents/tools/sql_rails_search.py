@@ -9,9 +9,12 @@ from __future__ import annotations
 import re
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from util.rails_naming import table_to_model
 
 from .base_tool import BaseTool
+from .ripgrep_tool import rg_type_args
 
 
 class SQLRailsSearchTool(BaseTool):
@@ -87,65 +90,42 @@ class SQLRailsSearchTool(BaseTool):
         # Cap number of patterns to avoid long searches
         patterns = patterns[:max_patterns]
 
-        # Execute rg for each pattern and collect results
-        results: List[Dict[str, Any]] = []
-        pattern_summaries: List[Dict[str, Any]] = []
-        seen_keys = set()
-
-        for pat in patterns:
-            rg_cmd = ["rg", "--line-number", "--with-filename"]
-            if case_insensitive:
-                rg_cmd.append("-i")
+        # Execute rg once with every pattern (-e each) so the tree is walked a
+        # single time, then attribute each hit to the patterns it matches
+        rg_cmd = ["rg", "--line-number", "--with-filename"]
+        if case_insensitive:
+            rg_cmd.append("-i")
 
-            # Restrict by file types
-            for ext in file_types:
-                rg_cmd.extend(["--type-add", f"target:{ext}", "--type", "target"])
-
-            # Use -S (smart case, literal/regex consistent) and -n -H already set
-            rg_cmd.extend([pat["regex"], self.project_root])
-
-            try:
-                r = subprocess.run(rg_cmd, capture_output=True, text=True, timeout=10)
-            except subprocess.TimeoutExpired:
-                pattern_summaries.append({"pattern": pat["label"], "regex": pat["regex"], "matches": 0, "error": "timeout"})
-                continue
-            except Exception as e:
-                pattern_summaries.append({"pattern": pat["label"], "regex": pat["regex"], "matches": 0, "error": str(e)})
-                continue
+        # Restrict by file types
+        rg_cmd.extend(rg_type_args(file_types))
 
-            count = 0
-            if r.returncode in (0, 1):  # 0=matches, 1=no matches
-                lines = [ln for ln in r.stdout.splitlines() if ln.strip()]
-                for ln in lines:
-                    if count >= max_per:
-                        break
-                    parts = ln.split(":", 2)
-                    if len(parts) < 3:
-                        continue
-                    file_path, line_str, content = parts
-                    try:
-                        line_no = int(line_str)
-                    except ValueError:
-                        continue
-
-                    # Make de-duplication key
-                    rel_path = self._rel_path(file_path)
-                    key = (rel_path, line_no, content.strip())
-                    if key in seen_keys:
-                        continue
-                    seen_keys.add(key)
-
-                    results.append(
-                        {
-                            "file": rel_path,
-                            "line": line_no,
-                            "content": content.strip(),
-                            "matched_pattern": pat["label"],
-                        }
+        results: List[Dict[str, Any]] = []
+        unattributed = 0
+        hits, error, invalid = self._run_rg(rg_cmd, [pat["regex"] for pat in patterns])
+
+        if invalid and len(patterns) > 1:
+            # rg rejected at least one regex and so searched none of them; run
+            # each pattern on its own so the valid ones still return hits
+            pattern_summaries = []
+            seen_keys: set = set()
+            rel_paths: Dict[str, str] = {}
+            for pat in patterns:
+                pat_hits, pat_error, _ = self._run_rg(rg_cmd, [pat["regex"]])
+                summary = {"pattern": pat["label"], "regex": pat["regex"], "matches": 0}
+                if pat_error is not None:
+                    summary["error"] = pat_error
+                else:
+                    summary["matches"] = self._take_hits(
+                        pat["label"], pat_hits, max_per, seen_keys, rel_paths, results
                     )
-                    count += 1
-
-            pattern_summaries.append({"pattern": pat["label"], "regex": pat["regex"], "matches": count})
+                pattern_summaries.append(summary)
+        elif error is not None:
+            pattern_summaries = [
+                {"pattern": pat["label"], "regex": pat["regex"], "matches": 0, "error": error}
+                for pat in patterns
+            ]
+        else:
+            results, pattern_summaries, unattributed = self._attribute_hits(patterns, hits, case_insensitive, max_per)
 
         return {
             "sql": sql,
@@ -155,8 +135,121 @@ class SQLRailsSearchTool(BaseTool):
             "patterns_tried": pattern_summaries,
             "results": results,
             "total_results": len(results),
+            # Lines rg matched that no pattern's Python regex matches (dialect differences)
+            "unattributed_matches": unattributed,
         }
 
+    def _run_rg(self, rg_cmd: List[str], regexes: List[str]) -> Tuple[List[Tuple[str, int, str]], Optional[str], bool]:
+        """Search the project for any of the regexes.
+
+        Returns (hits, error, invalid); invalid is True when rg exited with an
+        error (e.g. a regex it cannot parse), with its stderr as the error.
+        """
+        cmd = list(rg_cmd)
+        for regex in regexes:
+            cmd.extend(["-e", regex])
+        cmd.append(self.project_root)
+
+        try:
+            r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        except subprocess.TimeoutExpired:
+            return [], "timeout", False
+        except Exception as e:
+            return [], str(e), False
+
+        if r.returncode not in (0, 1):  # 0=matches, 1=no matches
+            return [], r.stderr.strip() or f"rg exited with code {r.returncode}", True
+        return self._parse_rg_lines(r.stdout), None, False
+
+    def _parse_rg_lines(self, output: str) -> List[Tuple[str, int, str]]:
+        """Parse rg ``file:line:content`` output into (file, line, content) tuples."""
+        hits = []
+        for ln in output.splitlines():
+            if not ln.strip():
+                continue
+            parts = ln.split(":", 2)
+            if len(parts) < 3:
+                continue
+            file_path, line_str, content = parts
+            try:
+                hits.append((file_path, int(line_str), content))
+            except ValueError:
+                continue
+        return hits
+
+    def _take_hits(
+        self,
+        label: str,
+        hits: Iterable[Tuple[str, int, str]],
+        max_per: int,
+        seen_keys: set,
+        rel_paths: Dict[str, str],
+        results: List[Dict[str, Any]],
+    ) -> int:
+        """Append up to max_per not-yet-seen hits to results; return how many were added."""
+        count = 0
+        for file_path, line_no, content in hits:
+            if count >= max_per:
+                break
+
+            # Make de-duplication key
+            rel_path = rel_paths.get(file_path)
+            if rel_path is None:
+                rel_path = rel_paths[file_path] = self._rel_path(file_path)
+            key = (rel_path, line_no, content.strip())
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+            results.append(
+                {
+                    "file": rel_path,
+                    "line": line_no,
+                    "content": content.strip(),
+                    "matched_pattern": label,
+                }
+            )
+            count += 1
+        return count
+
+    def _attribute_hits(
+        self,
+        patterns: List[Dict[str, str]],
+        hits: List[Tuple[str, int, str]],
+        case_insensitive: bool,
+        max_per: int,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int]:
+        """Assign rg hits to patterns in priority order.
+
+        Each line goes to the first pattern that matches it, and each pattern
+        keeps at most max_per lines, as if it had been searched on its own.
+        Also returns how many hits no pattern matched in Python's re dialect.
+        """
+        results: List[Dict[str, Any]] = []
+        pattern_summaries: List[Dict[str, Any]] = []
+        seen_keys: set = set()
+        rel_paths: Dict[str, str] = {}
+        flags = re.IGNORECASE if case_insensitive else 0
+        matchers = []
+
+        for pat in patterns:
+            try:
+                matcher = re.compile(pat["regex"], flags)
+            except re.error as e:
+                pattern_summaries.append({"pattern": pat["label"], "regex": pat["regex"], "matches": 0, "error": str(e)})
+                continue
+            matchers.append(matcher)
+
+            count = self._take_hits(
+                pat["label"],
+                (hit for hit in hits if matcher.search(hit[2])),
+                max_per, seen_keys, rel_paths, results,
+            )
+            pattern_summaries.append({"pattern": pat["label"], "regex": pat["regex"], "matches": count})
+
+        unattributed = sum(1 for hit in hits if not any(m.search(hit[2]) for m in matchers))
+        return results, pattern_summaries, unattributed
+
     def _rel_path(self, file_path: str) -> str:
         try:
             return str(Path(file_path).resolve().relative_to(Path(self.project_root).resolve()))
@@ -194,19 +287,7 @@ class SQLRailsSearchTool(BaseTool):
 
     def _table_to_model(self, table: str) -> str:
         # Minimal singularize + CamelCase (good enough for common cases)
-        t = table.lower()
-        if t.endswith("ies"):
-            singular = t[:-3] + "y"
-        elif t.endswith("ses"):
-            singular = t[:-2]
-        elif t.endswith("es") and not t.endswith("ses"):
-            singular = t[:-2]
-        elif t.endswith("s"):
-            singular = t[:-1]
-        else:
-            singular = t
-
-        return "".join(part.capitalize() for part in singular.split("_"))
+        return table_to_model(table)
 
     def _infer_patterns(self, parsed: Dict[str, Any]) -> List[Dict[str, str]]:
         """Build a prioritized list of ripgrep regex patterns to try."""
@@ -36,7 +36,6 @@ from rich.text import Text
 
 # Add parent directory to path for imports
 sys.path.append('..')
-from util.simple_pt_input import get_multiline_input
 from render.block_buffered import BlockBuffer
 from providers import get_provider
 from streaming_client import StreamingClient
@@ -348,12 +347,15 @@ def interactive_mode(url: str, provider, model: Optional[str], use_mock: bool =
                     timeout: float = 60.0,
                     live_window: int = 6) -> None:
     """Interactive mode with block-buffered Markdown rendering."""
+    # prompt_toolkit is slow to import; one-shot modes never need it
+    from util.simple_pt_input import get_multiline_input
+
     console.rule("LLM Debug CLI • Interactive Mode")
     console.print(Text("Type 'exit' or 'quit' to leave. Ctrl+J for new line, Enter to submit. Press Esc during stream.", style="dim"))
 
     while True:
         try:
-            user_input, _, _, _ = get_multiline_input(console, COLOR_PROMPT)
+            user_input = get_multiline_input(console, COLOR_PROMPT).text
             if user_input is None:
                 console.print("[dim]Bye![/dim]")
                 return
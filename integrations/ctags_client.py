@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 import io
 
+from util.rails_naming import class_to_table_name
+
 
 class CtagsClient:
     """
@@ -347,17 +349,7 @@ class CtagsClient:
 
     def _class_to_table_name(self, class_name: str) -> str:
         """Convert Rails model class name to table name."""
-        # Convert CamelCase to snake_case and pluralize
-        import re
-        snake_case = re.sub(r'([A-Z])', r'_\1', class_name).lower().lstrip('_')
-
-        # Simple pluralization
-        if snake_case.endswith('y'):
-            return snake_case[:-1] + 'ies'
-        elif snake_case.endswith(('s', 'sh', 'ch', 'x', 'z')):
-            return snake_case + 'es'
-        else:
-            return snake_case + 's'
+        return class_to_table_name(class_name)
 
     def analyze_rails_structure(self) -> Dict[str, Any]:
         """
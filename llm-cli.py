@@ -24,7 +24,6 @@ from typing import List, Optional
 from rich.console import Console
 from rich.text import Text
 from providers import get_provider
-from util.simple_pt_input import get_multiline_input
 from tools.definitions import AVAILABLE_TOOLS
 from tools.executor import ToolExecutor
 
@@ -203,6 +202,9 @@ def repl(
 
     Returns: Exit code (0 for success)
     """
+    # prompt_toolkit is slow to import; only pay for it once the REPL starts
+    from util.simple_pt_input import get_multiline_input
+
     console.rule("Talk 2 LLM • AI Core")
     console.print(Text("Type '/help' for commands or '/exit' to leave. Press Esc during stream, or Ctrl+C.", style="dim"))
 
@@ -253,10 +255,14 @@ def repl(
             # Get user input with usage display and history navigation
             context_status = context_manager.get_status_summary()
             display_string = f"{usage.get_display_string()} • {context_status}"
-            user_input, use_thinking, thinking_mode, tools_enabled = get_multiline_input(
+            turn = get_multiline_input(
                 console, PROMPT_STYLE, display_string, thinking_mode,
                 conversation.get_user_history(), tools_enabled, False, context_manager
             )
+            user_input = turn.text
+            use_thinking = turn.use_thinking
+            thinking_mode = turn.thinking_mode
+            tools_enabled = turn.tools_enabled
 
             # Handle exit conditions
             if should_exit_from_input(user_input):
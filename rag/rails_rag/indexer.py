@@ -10,13 +10,74 @@ Provides multiple indexing strategies:
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 import json
 
+from util.rails_naming import class_to_table_name
+
+# Patterns are compiled once at import instead of per call/per line
+_CLASS_RE = re.compile(r'^\s*class\s+([A-Z][a-zA-Z0-9_]*)')
+_ACTION_RE = re.compile(r'^\s*def\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+# All basic symbol kinds in one alternation: a single match per line either rejects
+# it or names the kind via ``lastgroup`` (the outer group closes last). Methods
+# capture an optional ``self.`` prefix to tell class methods apart.
+_SYMBOL_LINE_RE = re.compile(
+    r'^\s*(?:'
+    r'(?P<class>class\s+(?P<class_name>[A-Z][a-zA-Z0-9_]*))'
+    r'|(?P<module>module\s+(?P<module_name>[A-Z][a-zA-Z0-9_]*))'
+    r'|(?P<method>def\s+(?P<method_self>self\.)?(?P<method_name>[a-zA-Z_][a-zA-Z0-9_]*[!?]?))'
+    r'|(?P<constant>(?P<constant_name>[A-Z][A-Z0-9_]*)\s*=)'
+    r'|(?P<attr>attr_(?:reader|writer|accessor)\s+:(?P<attr_name>[a-zA-Z_][a-zA-Z0-9_]*))'
+    r')'
+)
+_ASSOCIATION_RE = re.compile(r'^\s*(has_many|has_one|belongs_to|has_and_belongs_to_many)\s+:([a-zA-Z_][a-zA-Z0-9_]*)')
+_RESOURCE_RE = re.compile(r'^\s*resources?\s+:([a-zA-Z_][a-zA-Z0-9_]*)')
+# Migration patterns run on raw bytes; only the (ASCII) captures get decoded
+_MIGRATION_CLASS_RE = re.compile(rb'class\s+([A-Z][a-zA-Z0-9_]*)')
+_CREATE_TABLE_RE = re.compile(rb'create_table\s+:([a-zA-Z_][a-zA-Z0-9_]*)')
+# ripgrep prefilter for model files worth scanning for associations/validations
+_MODEL_DECLARATION_RG_PATTERNS = [
+    r'^\s*(has_many|has_one|belongs_to|has_and_belongs_to_many)\s',
+    r'^\s*validates',
+]
+# The only controller lines _analyze_controller_file looks at: the class line,
+# method definitions and a bare "private"
+_CONTROLLER_RG_PATTERNS = [
+    r'^\s*class\s',
+    r'^\s*def\s',
+    r'^\s*private\s*$',
+]
+# Literals every association/validation line contains (has_and_belongs_to_many
+# is covered by belongs_to); used to skip those scans without rg
+_MODEL_DECLARATION_LITERALS = ('belongs_to', 'has_one', 'has_many', 'validates')
+
+
+# Per-file structural parse results keyed by (root, path, mtime_ns, size), so
+# re-indexing in the same session only re-parses files that changed
+_STRUCTURE_CACHE: OrderedDict = OrderedDict()
+_STRUCTURE_CACHE_MAX = 1024
+# Filled from the build_structural_index thread pool
+_STRUCTURE_CACHE_LOCK = threading.Lock()
+
+
+def _starts_with_keyword(stripped: str, keyword: str) -> bool:
+    """Return True if an lstripped line starts with ``keyword`` as a whole word."""
+    if not stripped.startswith(keyword):
+        return False
+    if len(stripped) == len(keyword):
+        return True
+    following = stripped[len(keyword)]
+    return not (following.isalnum() or following == '_')
+
 
 class RailsCodeIndexer:
     """
@@ -83,13 +144,120 @@ class RailsCodeIndexer:
 
         return False
 
+    def _rg_files(self, root: Path, glob: str) -> List[Path]:
+        """
+        List files under root matching glob.
+
+        Uses ``rg --files``, which walks directories in parallel and prunes
+        gitignored trees (node_modules, tmp/cache, ...). Falls back to
+        _walk_files when ripgrep is not installed or fails.
+        """
+        try:
+            result = subprocess.run(
+                ["rg", "--files", "--hidden", "-g", glob, str(root)],
+                capture_output=True, timeout=30,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return self._walk_files(root, glob)
+
+        # rg exits 1 when nothing matched; anything else is an error
+        if result.returncode not in (0, 1):
+            return self._walk_files(root, glob)
+
+        # fsdecode keeps non-UTF-8 file names intact (surrogate-escaped), like os.walk
+        return [Path(os.fsdecode(line)) for line in result.stdout.splitlines() if line]
+
+    def _walk_files(self, root: Path, glob: str) -> List[Path]:
+        """
+        List files under root whose name matches glob, without ripgrep.
+
+        An os.scandir walk that never descends into directories the exclude
+        patterns would reject anyway (tmp, log, vendor, node_modules, ...),
+        and only builds Path objects for the files it returns.
+        """
+        pruned = {pattern.strip("*/") for pattern in self.exclude_patterns}
+        files = []
+        stack = [str(root)]
+
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in pruned:
+                                stack.append(entry.path)
+                        elif fnmatch.fnmatchcase(entry.name, glob):
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
+
+        return files
+
+    def _rg_matching_files(self, root: Path, patterns: List[str]) -> Optional[Set[Path]]:
+        """
+        Return files under root containing any of the regex patterns.
+
+        Lets callers skip Python-side line scans for files that cannot match.
+        Returns None when ripgrep is unavailable, meaning "scan everything".
+        """
+        cmd = ["rg", "-l", "--hidden", "-g", "*.rb"]
+        for pattern in patterns:
+            cmd += ["-e", pattern]
+        cmd.append(str(root))
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+        if result.returncode not in (0, 1):
+            return None
+
+        return {Path(os.fsdecode(line)) for line in result.stdout.splitlines() if line}
+
+    def _rg_matching_lines(self, root: Path, patterns: List[str]) -> Optional[Dict[str, Optional[List[str]]]]:
+        """
+        Return the lines matching any of the patterns, grouped by file path.
+
+        One rg call covers every file under root, so callers can analyze a
+        whole directory without reading each file in Python. Returns None
+        when ripgrep is unavailable. A file whose matched lines are not valid
+        UTF-8 maps to None, so the caller can handle it on its own.
+        """
+        cmd = ["rg", "--line-number", "--with-filename", "--null", "--hidden", "-g", "*.rb"]
+        for pattern in patterns:
+            cmd += ["-e", pattern]
+        cmd.append(str(root))
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+        if result.returncode not in (0, 1):
+            return None
+
+        # --null output: path NUL line_number ":" content
+        lines_by_file: Dict[str, Optional[List[str]]] = {}
+        for entry in result.stdout.splitlines():
+            raw_path, _, rest = entry.partition(b'\0')
+            path = os.fsdecode(raw_path)
+            lines = lines_by_file.setdefault(path, [])
+            if lines is None:
+                continue
+            try:
+                lines.append(rest.partition(b':')[2].decode('utf-8'))
+            except UnicodeDecodeError:
+                lines_by_file[path] = None
+        return lines_by_file
+
     def _find_ruby_files(self) -> List[Path]:
         """Find all Ruby files to index."""
         ruby_files = []
 
         for rails_path in self.rails_paths.values():
             if rails_path.exists():
-                for file_path in rails_path.rglob("*.rb"):
+                for file_path in self._rg_files(rails_path, "*.rb"):
                     if self._should_index_file(file_path):
                         ruby_files.append(file_path)
 
@@ -113,34 +281,19 @@ class RailsCodeIndexer:
 
         ruby_files = self._find_ruby_files()
 
-        for file_path in ruby_files:
-            try:
-                rel_path = file_path.relative_to(self.project_root)
-                content = file_path.read_text(encoding='utf-8')
-
-                file_entry = {
-                    "path": str(rel_path),
-                    "size": len(content),
-                    "lines": len(content.split('\n')),
-                    "type": self._classify_rails_file(file_path),
-                }
-
-                # Extract classes and modules with basic regex
-                classes = self._extract_classes(content, str(rel_path))
-                methods = self._extract_methods(content, str(rel_path))
-                modules = self._extract_modules(content, str(rel_path))
-
-                file_entry["classes"] = len(classes)
-                file_entry["methods"] = len(methods)
-                file_entry["modules"] = len(modules)
-
-                structural_index["files"].append(file_entry)
-                structural_index["classes"].extend(classes)
-                structural_index["methods"].extend(methods)
-                structural_index["modules"].extend(modules)
+        # Reads dominate on a cold cache; overlap them across threads. map()
+        # keeps results in file order.
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(self._index_file_structure, ruby_files))
 
-            except Exception as e:
-                print(f"    Error indexing {file_path}: {e}")
+        for result in results:
+            if result is None:
+                continue
+            file_entry, classes, methods, modules = result
+            structural_index["files"].append(file_entry)
+            structural_index["classes"].extend(classes)
+            structural_index["methods"].extend(methods)
+            structural_index["modules"].extend(modules)
 
         print(f"    Structural index: {len(structural_index['files'])} files, "
               f"{len(structural_index['classes'])} classes, "
@@ -178,69 +331,83 @@ class RailsCodeIndexer:
         else:
             return "other"
 
-    def _extract_classes(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Extract class definitions from Ruby content."""
+    def _index_file_structure(self, file_path: Path) -> Optional[Tuple[Dict[str, Any], List, List, List]]:
+        """Read and parse one Ruby file for the structural index.
+
+        Returns (file_entry, classes, methods, modules), or None on error.
+        """
+        try:
+            st = file_path.stat()
+            key = (str(self.project_root), str(file_path), st.st_mtime_ns, st.st_size)
+            with _STRUCTURE_CACHE_LOCK:
+                cached = _STRUCTURE_CACHE.get(key)
+                if cached is not None:
+                    _STRUCTURE_CACHE.move_to_end(key)
+                    return cached
+
+            rel_path = file_path.relative_to(self.project_root)
+            content = file_path.read_text(encoding='utf-8')
+
+            file_entry = {
+                "path": str(rel_path),
+                "size": len(content),
+                "lines": content.count('\n') + 1,
+                "type": self._classify_rails_file(file_path),
+            }
+
+            classes, methods, modules = self._extract_structure(content, str(rel_path))
+
+            file_entry["classes"] = len(classes)
+            file_entry["methods"] = len(methods)
+            file_entry["modules"] = len(modules)
+
+            result = (file_entry, classes, methods, modules)
+            with _STRUCTURE_CACHE_LOCK:
+                _STRUCTURE_CACHE[key] = result
+                if len(_STRUCTURE_CACHE) > _STRUCTURE_CACHE_MAX:
+                    _STRUCTURE_CACHE.popitem(last=False)
+            return result
+
+        except Exception as e:
+            print(f"    Error indexing {file_path}: {e}")
+            return None
+
+    def _extract_structure(self, content: str, file_path: str) -> Tuple[List, List, List]:
+        """Extract class, method and module definitions from Ruby content in one pass."""
         classes = []
-        lines = content.split('\n')
+        methods = []
+        modules = []
 
-        class_pattern = re.compile(r'^\s*class\s+([A-Z][a-zA-Z0-9_]*)')
+        for line_num, line in enumerate(content.split('\n'), 1):
+            match = _SYMBOL_LINE_RE.match(line)
+            if not match:
+                continue
 
-        for line_num, line in enumerate(lines, 1):
-            match = class_pattern.match(line)
-            if match:
-                class_name = match.group(1)
+            kind = match.lastgroup
+            if kind == "class":
                 classes.append({
-                    "name": class_name,
+                    "name": match.group("class_name"),
                     "file": file_path,
                     "line": line_num,
                     "definition": line.strip(),
                 })
-
-        return classes
-
-    def _extract_methods(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Extract method definitions from Ruby content."""
-        methods = []
-        lines = content.split('\n')
-
-        # Match both def method_name and def self.method_name
-        method_pattern = re.compile(r'^\s*def\s+(self\.)?([a-zA-Z_][a-zA-Z0-9_]*[!?]?)')
-
-        for line_num, line in enumerate(lines, 1):
-            match = method_pattern.match(line)
-            if match:
-                is_class_method = match.group(1) is not None
-                method_name = match.group(2)
-
+            elif kind == "method":
                 methods.append({
-                    "name": method_name,
+                    "name": match.group("method_name"),
                     "file": file_path,
                     "line": line_num,
-                    "is_class_method": is_class_method,
+                    "is_class_method": match.group("method_self") is not None,
                     "definition": line.strip(),
                 })
-
-        return methods
-
-    def _extract_modules(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Extract module definitions from Ruby content."""
-        modules = []
-        lines = content.split('\n')
-
-        module_pattern = re.compile(r'^\s*module\s+([A-Z][a-zA-Z0-9_]*)')
-
-        for line_num, line in enumerate(lines, 1):
-            match = module_pattern.match(line)
-            if match:
-                module_name = match.group(1)
+            elif kind == "module":
                 modules.append({
-                    "name": module_name,
+                    "name": match.group("module_name"),
                     "file": file_path,
                     "line": line_num,
                     "definition": line.strip(),
                 })
 
-        return modules
+        return classes, methods, modules
 
     def build_symbol_index(self) -> Dict[str, Any]:
         """
@@ -341,32 +508,19 @@ class RailsCodeIndexer:
         symbols = []
         lines = content.split('\n')
 
-        patterns = {
-            "class": re.compile(r'^\s*class\s+([A-Z][a-zA-Z0-9_]*)'),
-            "module": re.compile(r'^\s*module\s+([A-Z][a-zA-Z0-9_]*)'),
-            "method": re.compile(r'^\s*def\s+(self\.)?([a-zA-Z_][a-zA-Z0-9_]*[!?]?)'),
-            "constant": re.compile(r'^\s*([A-Z][A-Z0-9_]*)\s*='),
-            "attr": re.compile(r'^\s*attr_(reader|writer|accessor)\s+:([a-zA-Z_][a-zA-Z0-9_]*)'),
-        }
-
         for line_num, line in enumerate(lines, 1):
-            for symbol_type, pattern in patterns.items():
-                match = pattern.match(line)
-                if match:
-                    if symbol_type == "method":
-                        symbol_name = match.group(2)
-                    elif symbol_type == "attr":
-                        symbol_name = match.group(2)
-                    else:
-                        symbol_name = match.group(1)
-
-                    symbols.append({
-                        "name": symbol_name,
-                        "kind": symbol_type,
-                        "file": file_path,
-                        "line": line_num,
-                        "pattern": line.strip(),
-                    })
+            match = _SYMBOL_LINE_RE.match(line)
+            if not match:
+                continue
+
+            symbol_type = match.lastgroup
+            symbols.append({
+                "name": match.group(f"{symbol_type}_name"),
+                "kind": symbol_type,
+                "file": file_path,
+                "line": line_num,
+                "pattern": line.strip(),
+            })
 
         return symbols
 
@@ -421,14 +575,21 @@ class RailsCodeIndexer:
         if not models_dir.exists():
             return models
 
-        for model_file in models_dir.rglob("*.rb"):
+        # Pre-search for files declaring associations/validations so the rest
+        # only need their class line found
+        declaring = self._rg_matching_files(models_dir, _MODEL_DECLARATION_RG_PATTERNS)
+
+        for model_file in self._rg_files(models_dir, "*.rb"):
             if self._should_index_file(model_file):
                 try:
                     rel_path = model_file.relative_to(self.project_root)
                     content = model_file.read_text(encoding='utf-8')
 
                     # Extract model information
-                    model_info = self._analyze_model_file(content, str(rel_path))
+                    model_info = self._analyze_model_file(
+                        content, str(rel_path),
+                        scan_declarations=declaring is None or model_file in declaring,
+                    )
                     if model_info:
                         models.append(model_info)
 
@@ -437,14 +598,19 @@ class RailsCodeIndexer:
 
         return models
 
-    def _analyze_model_file(self, content: str, file_path: str) -> Optional[Dict[str, Any]]:
-        """Analyze a Rails model file for conventions."""
+    def _analyze_model_file(self, content: str, file_path: str,
+                            scan_declarations: bool = True) -> Optional[Dict[str, Any]]:
+        """Analyze a Rails model file for conventions.
+
+        scan_declarations=False skips the association/validation scans for
+        files already known not to contain any.
+        """
         lines = content.split('\n')
 
         # Find class definition
         class_match = None
         for line in lines:
-            match = re.match(r'^\s*class\s+([A-Z][a-zA-Z0-9_]*)', line)
+            match = _CLASS_RE.match(line)
             if match:
                 class_match = match
                 break
@@ -457,11 +623,15 @@ class RailsCodeIndexer:
         # Extract table name using Rails conventions
         table_name = self._class_to_table_name(class_name)
 
-        # Look for associations
-        associations = self._extract_associations(content)
+        if scan_declarations and any(lit in content for lit in _MODEL_DECLARATION_LITERALS):
+            # Look for associations
+            associations = self._extract_associations(content)
 
-        # Look for validations
-        validations = self._extract_validations(content)
+            # Look for validations
+            validations = self._extract_validations(content)
+        else:
+            associations = []
+            validations = []
 
         return {
             "class_name": class_name,
@@ -473,26 +643,15 @@ class RailsCodeIndexer:
 
     def _class_to_table_name(self, class_name: str) -> str:
         """Convert Rails model class name to table name."""
-        # Simple pluralization (could use inflection library)
-        snake_case = re.sub(r'([A-Z])', r'_\1', class_name).lower().lstrip('_')
-
-        # Basic pluralization rules
-        if snake_case.endswith('y'):
-            return snake_case[:-1] + 'ies'
-        elif snake_case.endswith(('s', 'sh', 'ch', 'x', 'z')):
-            return snake_case + 'es'
-        else:
-            return snake_case + 's'
+        return class_to_table_name(class_name)
 
     def _extract_associations(self, content: str) -> List[Dict[str, str]]:
         """Extract Rails associations from model content."""
         associations = []
         lines = content.split('\n')
 
-        association_pattern = re.compile(r'^\s*(has_many|has_one|belongs_to|has_and_belongs_to_many)\s+:([a-zA-Z_][a-zA-Z0-9_]*)')
-
         for line in lines:
-            match = association_pattern.match(line)
+            match = _ASSOCIATION_RE.match(line)
             if match:
                 assoc_type = match.group(1)
                 assoc_name = match.group(2)
@@ -508,10 +667,8 @@ class RailsCodeIndexer:
         validations = []
         lines = content.split('\n')
 
-        validation_pattern = re.compile(r'^\s*validates')
-
         for line in lines:
-            if validation_pattern.match(line):
+            if line.lstrip().startswith('validates'):
                 validations.append(line.strip())
 
         return validations
@@ -524,11 +681,19 @@ class RailsCodeIndexer:
         if not controllers_dir.exists():
             return controllers
 
-        for controller_file in controllers_dir.rglob("*.rb"):
+        # With ripgrep, fetch the class/def/private lines of every controller in
+        # one call; the analysis below only ever looks at those lines
+        relevant_lines = self._rg_matching_lines(controllers_dir, _CONTROLLER_RG_PATTERNS)
+
+        for controller_file in self._rg_files(controllers_dir, "*.rb"):
             if self._should_index_file(controller_file):
                 try:
                     rel_path = controller_file.relative_to(self.project_root)
-                    content = controller_file.read_text(encoding='utf-8')
+                    matched = relevant_lines.get(str(controller_file), ()) if relevant_lines is not None else None
+                    if matched is not None:
+                        content = '\n'.join(matched)
+                    else:
+                        content = controller_file.read_text(encoding='utf-8')
 
                     controller_info = self._analyze_controller_file(content, str(rel_path))
                     if controller_info:
@@ -546,7 +711,7 @@ class RailsCodeIndexer:
         # Find class definition
         class_match = None
         for line in lines:
-            match = re.match(r'^\s*class\s+([A-Z][a-zA-Z0-9_]*)', line)
+            match = _CLASS_RE.match(line)
             if match:
                 class_match = match
                 break
@@ -571,16 +736,14 @@ class RailsCodeIndexer:
         lines = content.split('\n')
 
         in_private = False
-        method_pattern = re.compile(r'^\s*def\s+([a-zA-Z_][a-zA-Z0-9_]*)')
-
         for line in lines:
             line = line.strip()
             if line == "private":
                 in_private = True
                 continue
 
-            if not in_private:
-                match = method_pattern.match(line)
+            if not in_private and _starts_with_keyword(line, 'def'):
+                match = _ACTION_RE.match(line)
                 if match:
                     actions.append(match.group(1))
 
@@ -594,10 +757,8 @@ class RailsCodeIndexer:
             content = routes_file.read_text(encoding='utf-8')
             lines = content.split('\n')
 
-            resource_pattern = re.compile(r'^\s*resources?\s+:([a-zA-Z_][a-zA-Z0-9_]*)')
-
             for line in lines:
-                match = resource_pattern.match(line)
+                match = _RESOURCE_RE.match(line)
                 if match:
                     resource_name = match.group(1)
                     routes.append({
@@ -618,7 +779,7 @@ class RailsCodeIndexer:
         for migration_file in migration_dir.glob("*.rb"):
             try:
                 rel_path = migration_file.relative_to(self.project_root)
-                content = migration_file.read_text(encoding='utf-8')
+                content = migration_file.read_bytes()
 
                 migration_info = self._analyze_migration_file(content, str(rel_path))
                 if migration_info:
@@ -629,20 +790,20 @@ class RailsCodeIndexer:
 
         return migrations
 
-    def _analyze_migration_file(self, content: str, file_path: str) -> Optional[Dict[str, Any]]:
-        """Analyze a Rails migration file."""
+    def _analyze_migration_file(self, content: bytes, file_path: str) -> Optional[Dict[str, Any]]:
+        """Analyze a Rails migration file from its raw bytes."""
         # Extract migration class name and table operations
-        class_match = re.search(r'class\s+([A-Z][a-zA-Z0-9_]*)', content)
+        class_match = _MIGRATION_CLASS_RE.search(content)
         if not class_match:
             return None
 
-        class_name = class_match.group(1)
+        class_name = class_match.group(1).decode('ascii')
 
         # Look for table operations
         table_operations = []
-        create_table_matches = re.findall(r'create_table\s+:([a-zA-Z_][a-zA-Z0-9_]*)', content)
+        create_table_matches = _CREATE_TABLE_RE.findall(content)
         for table in create_table_matches:
-            table_operations.append({"type": "create", "table": table})
+            table_operations.append({"type": "create", "table": table.decode('ascii')})
 
         return {
             "class_name": class_name,
@@ -16,6 +16,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import json
 
+# Bare PascalCase class name or snake_case method name (optionally ending in ! or ?)
+_SYMBOL_QUERY_RE = re.compile(r'[A-Z][a-zA-Z0-9_]*|[a-z_][a-zA-Z0-9_]*[!?]?')
+
 
 class RailsCodeSearcher:
     """
@@ -78,10 +81,10 @@ class RailsCodeSearcher:
         if any(keyword in query_lower for keyword in sql_keywords):
             return "sql"
 
-        # Symbol indicators (class/method names)
-        if re.match(r'^[A-Z][a-zA-Z0-9_]*$', query.strip()):  # PascalCase
-            return "symbol"
-        if re.match(r'^[a-z_][a-zA-Z0-9_]*[!?]?$', query.strip()):  # snake_case/method
+        # Symbol indicators (class/method names). Natural-language queries
+        # contain spaces and can never match, so skip the regex for them.
+        stripped = query.strip()
+        if ' ' not in stripped and _SYMBOL_QUERY_RE.fullmatch(stripped):
             return "symbol"
 
         # Default to semantic for natural language
@@ -3,20 +3,142 @@
 from __future__ import annotations
 
 import json
+import select
 import sys
+import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator, Union
 from requests.exceptions import RequestException, ReadTimeout, ConnectTimeout
 import requests
+from requests.adapters import HTTPAdapter
 
 from tools.executor import ToolExecutor
 from rich.console import Console
 from render.markdown_live import MarkdownStream
 from util.input_helpers import _raw_mode, _esc_pressed
 
+try:
+    import orjson
+except ImportError:
+    # Optional faster JSON decoding; fall back to stdlib json
+    orjson = None
+
+# Both accept bytes; decode errors from either are ValueError subclasses
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Global abort flag for stream interruption
 _ABORT = False
 
+# Bytes requested per read when streaming SSE responses
+_SSE_CHUNK_SIZE = 8192
+
+# Shared session used when callers don't pass one, so keep-alive connections survive across turns
+_DEFAULT_SESSION: Optional[requests.Session] = None
+
+
+def _get_default_session() -> requests.Session:
+    """Return the shared pooled session, creating it on first use."""
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        _DEFAULT_SESSION = session
+    return _DEFAULT_SESSION
+
+
+def _sse_payload(raw: bytearray) -> Optional[bytearray]:
+    """Return one raw SSE line without its "data:" prefix; None for blank lines."""
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    if not raw:
+        return None
+    if raw.startswith(b"data:"):
+        raw = raw[6:] if raw[5:6] == b" " else raw[5:]
+        if raw[:1].isspace():
+            raw = raw.lstrip()
+    return raw
+
+
+def _sse_line(raw: bytearray) -> Optional[str]:
+    """Decode one raw SSE line, dropping a "data:" prefix; None for blank lines."""
+    payload = _sse_payload(raw)
+    return None if payload is None else payload.decode("utf-8", "replace")
+
+
+def _iter_sse_reads(chunks: Iterator[bytes], parse_line=_sse_line) -> Iterator[list]:
+    """Yield the SSE lines completed by each chunk read from the response.
+
+    Each line goes through ``parse_line``; lines it maps to None are dropped.
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf += chunk
+        lines = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            line = parse_line(buf[start:end])
+            start = end + 1
+            if line is not None:
+                lines.append(line)
+        del buf[:start]
+        yield lines
+    if buf:
+        # Final line without a trailing newline
+        line = parse_line(buf)
+        if line is not None:
+            yield [line]
+
+
+def _response_fileno(response) -> Optional[int]:
+    """Return the socket descriptor behind a streamed response, if it exposes one."""
+    try:
+        fd = response.raw.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+def _data_within(fd: Optional[int], seconds: float) -> bool:
+    """Wait up to ``seconds`` for ``fd`` to become readable; False when it cannot be polled."""
+    if fd is None:
+        return False
+    try:
+        readable, _, _ = select.select([fd], [], [], max(seconds, 0.0))
+    except (OSError, ValueError):
+        return False
+    return bool(readable)
+
+
+def _batch_sse_reads(reads: Iterator[List[str]], window: float, fd: Optional[int]) -> Iterator[List[str]]:
+    """Coalesce per-read SSE lines into batches flushed at most once per ``window`` seconds.
+
+    A pending batch is also flushed early on ``[DONE]`` or when no more data
+    arrives before the window closes. Without a pollable socket every read is
+    its own batch.
+    """
+    pending: List[str] = []
+    last_flush = time.monotonic()
+    for lines in reads:
+        if not lines:
+            continue
+        pending.extend(lines)
+        remaining = window - (time.monotonic() - last_flush)
+        if remaining <= 0 or "[DONE]" in lines or not _data_within(fd, remaining):
+            yield pending
+            pending = []
+            last_flush = time.monotonic()
+    if pending:
+        yield pending
+
+
 @dataclass
 class StreamResult:
     """Result from streaming an LLM request."""
@@ -55,19 +177,60 @@ class StreamingClient:
         params: Optional[Dict[str, str]] = None,
         timeout: float = 60.0,
         session: Optional[requests.Session] = None,
-    ) -> Iterator[str]:
+        batch_ms: float = 0.0,
+    ) -> Iterator[Union[str, List[str]]]:
         """Yield SSE data lines from an HTTP response.
 
         Strips the leading "data:" prefix when present and skips empty keep-alive lines.
+        The body is read in raw chunks and split on newlines here, so only complete
+        lines are decoded.
+
+        With ``batch_ms`` > 0, lines are yielded as lists instead: a batch is
+        flushed once ``batch_ms`` has passed since the previous one, when the
+        stream goes quiet, or when it contains the ``[DONE]`` sentinel.
+        """
+        sse_session = session or _get_default_session()
+        req = sse_session.get if method.upper() == "GET" else sse_session.post
+        with req(url, json=json, params=params, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            reads = _iter_sse_reads(r.iter_content(chunk_size=_SSE_CHUNK_SIZE))
+            if batch_ms > 0:
+                yield from _batch_sse_reads(reads, batch_ms / 1000.0, _response_fileno(r))
+            else:
+                for lines in reads:
+                    yield from lines
+
+    def iter_sse_json(
+        self,
+        url: str,
+        *,
+        method: str = "POST",
+        json: Optional[dict] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: float = 60.0,
+        session: Optional[requests.Session] = None,
+    ) -> Iterator[dict]:
+        """Yield decoded JSON objects from an SSE response.
+
+        Like iter_sse_lines, but each payload is parsed straight from the raw
+        bytes (with orjson when installed) instead of being decoded to str
+        first. The ``[DONE]`` sentinel and lines that aren't JSON objects
+        (``event:``, ``id:``, comments) are skipped.
         """
-        sse_session = session or requests.Session()
+        sse_session = session or _get_default_session()
         req = sse_session.get if method.upper() == "GET" else sse_session.post
         with req(url, json=json, params=params, stream=True, timeout=timeout) as r:
             r.raise_for_status()
-            for raw in r.iter_lines(decode_unicode=True):
-                if not raw:
-                    continue
-                yield raw[5:].lstrip() if raw.startswith("data:") else raw
+            for payloads in _iter_sse_reads(r.iter_content(chunk_size=_SSE_CHUNK_SIZE), _sse_payload):
+                for payload in payloads:
+                    if payload == b"[DONE]":
+                        continue
+                    try:
+                        obj = _json_loads(payload)
+                    except ValueError:
+                        continue
+                    if isinstance(obj, dict):
+                        yield obj
 
     def send_message(
         self,
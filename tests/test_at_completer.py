@@ -31,3 +31,32 @@ def test_at_completions_basic(tmp_path, monkeypatch):
     texts = [c.text for c in completions]
     assert "@dir/nested.md" in texts
 
+
+def test_at_completions_capped_and_sorted(tmp_path, monkeypatch):
+    for name in ("c.txt", "a.txt", "b.txt", "d.txt"):
+        (tmp_path / name).write_text("x")
+
+    monkeypatch.chdir(tmp_path)
+
+    comp = AtCommandCompleter(max_completions=2)
+    texts = [c.text for c in comp._get_path_completions("")]
+    assert texts == ["@a.txt", "@b.txt"]
+
+    # Missing directories yield nothing rather than raising
+    assert list(comp._get_path_completions("missing/")) == []
+
+
+def test_at_completions_only_for_current_word(tmp_path, monkeypatch):
+    from prompt_toolkit.document import Document
+
+    (tmp_path / "file.txt").write_text("x")
+    monkeypatch.chdir(tmp_path)
+
+    comp = AtCommandCompleter()
+
+    texts = [c.text for c in comp.get_completions(Document("see @fi"), None)]
+    assert texts == ["@file.txt"]
+
+    # A space after the @ ends the command
+    assert list(comp.get_completions(Document("@fi then"), None)) == []
+    assert list(comp.get_completions(Document("no at sign"), None)) == []
@@ -197,11 +197,11 @@ class TestSSEClientErrors:
         except Exception as e:
             assert "HTTP 404" in str(e)
 
-    def test_iter_lines_error(self):
-        """Test SSE client when iter_lines raises exception."""
+    def test_iter_content_error(self):
+        """Test SSE client when iter_content raises exception."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.iter_lines.side_effect = Exception("Stream error")
+        mock_response.iter_content.side_effect = Exception("Stream error")
 
         mock_session = Mock()
         mock_session.post.return_value.__enter__ = Mock(return_value=mock_response)
@@ -311,7 +311,7 @@ def test_all_error_scenarios():
     sse_tests = TestSSEClientErrors()
     sse_tests.test_http_connection_error()
     sse_tests.test_http_status_error()
-    sse_tests.test_iter_lines_error()
+    sse_tests.test_iter_content_error()
 
     print("Testing Bedrock provider errors...")
     bedrock_tests = TestBedrockProviderErrors()
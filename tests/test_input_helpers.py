@@ -11,3 +11,17 @@ def test_should_exit_from_input():
     assert should_exit_from_input("/quit") is False
     assert should_exit_from_input("exit") is False
 
+
+def test_raw_mode_and_esc_are_noops_without_tty(monkeypatch):
+    import io
+    import sys
+
+    from util.input_helpers import _esc_pressed, _raw_mode
+
+    fake_stdin = io.StringIO("\x1b")
+    monkeypatch.setattr(sys, "stdin", fake_stdin)
+
+    with _raw_mode(sys.stdin):
+        assert _esc_pressed(0.0) is False
+    # Nothing was consumed from the non-TTY stream
+    assert fake_stdin.read() == "\x1b"
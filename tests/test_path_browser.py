@@ -91,3 +91,103 @@ def test_format_directory_listing_and_validation(tmp_path):
         assert rel == "ok.txt"
     finally:
         os.chdir(cwd)
+
+
+def test_list_directory_cached_until_directory_changes(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+
+    pb = PathBrowser()
+    first = pb.list_directory(str(tmp_path))
+    assert [it.name for it in first] == ["a.txt"]
+
+    # Unchanged directory is served from the cache
+    assert pb.list_directory(str(tmp_path)) == first
+    assert len(pb._dir_cache) == 1
+
+    # Adding an entry bumps the directory mtime and invalidates the listing
+    (tmp_path / "b.txt").write_text("b")
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    names = [it.name for it in pb.list_directory(str(tmp_path))]
+    assert names == ["a.txt", "b.txt"]
+
+
+def test_list_directory_reports_current_size_of_cached_entries(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_text("a")
+    st = os.stat(tmp_path)
+
+    pb = PathBrowser()
+    assert [it.size for it in pb.list_directory(str(tmp_path))] == [1]
+
+    # Rewriting a file in place leaves the directory mtime alone
+    f.write_text("x" * 5000)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert [it.size for it in pb.list_directory(str(tmp_path))] == [5000]
+    assert len(pb._dir_cache) == 1
+
+
+def test_list_directory_caps_to_first_items_by_name(tmp_path):
+    for name in ("d.txt", "b.txt", "c.txt", "a.txt", ".z"):
+        (tmp_path / name).write_text(name)
+
+    pb = PathBrowser(max_items=2)
+    items = pb.list_directory(str(tmp_path))
+    assert [it.name for it in items] == ["a.txt", "b.txt"]
+    assert all(it.size == 5 for it in items)
+
+
+def test_validate_file_accepts_multibyte_char_at_read_boundary(tmp_path):
+    f = tmp_path / "utf8.txt"
+    # 1023 ASCII bytes followed by a 3-byte character straddling the 1024-byte window
+    f.write_text("a" * 1023 + "€", encoding="utf-8")
+
+    is_valid, msg = PathBrowser().validate_file_for_context(str(f))
+    assert is_valid is True and msg == ""
+
+
+def test_validate_file_rejects_short_file_ending_mid_character(tmp_path):
+    f = tmp_path / "truncated.txt"
+    # Shorter than the probe window, ending in the first two bytes of "€"
+    f.write_bytes(b"abc" + "€".encode("utf-8")[:2])
+
+    is_valid, msg = PathBrowser().validate_file_for_context(str(f))
+    assert is_valid is False and "not valid UTF-8" in msg
+
+
+def test_format_file_size_units():
+    pb = PathBrowser()
+    assert pb._format_file_size(None) == "unknown"
+    assert pb._format_file_size(0) == "0B"
+    assert pb._format_file_size(1023) == "1023B"
+    assert pb._format_file_size(1024) == "1.0K"
+    assert pb._format_file_size(3 * 1024 * 1024) == "3.0M"
+    assert pb._format_file_size(5 * 1024 ** 4) == "5120.0G"
+
+
+def test_parse_at_command_lexical_vs_resolved(tmp_path, monkeypatch):
+    target = tmp_path / "real"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    monkeypatch.chdir(tmp_path)
+
+    pb = PathBrowser()
+    lexical, is_dir = pb.parse_at_command("@link/../link/")
+    assert is_dir is True
+    assert lexical == os.path.join(os.getcwd(), "link")
+
+    resolved, is_dir = pb.parse_at_command("@link/", resolve=True)
+    assert is_dir is True
+    assert resolved == str(target.resolve())
+
+
+def test_parse_at_command_rechecks_file_or_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pb = PathBrowser()
+
+    assert pb.parse_at_command("@foo")[1] is False
+    (tmp_path / "foo").mkdir()
+    assert pb.parse_at_command("@foo")[1] is True
+    (tmp_path / "foo").rmdir()
+    assert pb.parse_at_command("@foo", resolve=True)[1] is False
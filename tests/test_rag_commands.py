@@ -63,8 +63,15 @@ def test_rag_index_and_search(tmp_path):
     console.reset_mock()
     assert handle_special_commands("/rag search hello 5", conv, console, None, None, rag) is True
     rag.search.assert_called_with("hello", k=5)
-    # Expect at least one print for header and one for result
-    assert console.print.call_count >= 2
+    # Header and results are rendered in one batched print
+    console.print.assert_called_once()
+    output = console.print.call_args[0][0]
+    assert "Top 1" in output and "/x/doc.txt#0-10" in output and "hello world" in output
+
+    # A lone numeric token is the query, not k
+    rag.default_k = 3
+    assert handle_special_commands("/rag search 2024", conv, console, None, None, rag) is True
+    rag.search.assert_called_with("2024", k=3)
 
     # /rag clear
     console.reset_mock()
@@ -72,3 +79,28 @@ def test_rag_index_and_search(tmp_path):
     rag.clear.assert_called_once()
     assert console.print.called
 
+
+def test_rag_search_preview_is_bounded():
+    console = Mock()
+    rag = Mock()
+    rag.search.return_value = [
+        {"path": "/x/big.txt", "start": 0, "end": 5000, "text": "line\n" * 1000}
+    ]
+
+    assert handle_special_commands("/rag search line 1", Mock(), console, None, None, rag) is True
+    output = console.print.call_args[0][0]
+    preview = output.rsplit("\n    ", 1)[1]
+    assert "\n" not in preview
+    assert len(preview) == 160 and preview.endswith("...")
+
+
+def test_rag_search_preview_marks_truncation_after_leading_whitespace():
+    console = Mock()
+    rag = Mock()
+    rag.search.return_value = [
+        {"path": "/x/doc.txt", "start": 0, "end": 400, "text": " " * 100 + "short head" + " " * 100 + "tail" * 50}
+    ]
+
+    assert handle_special_commands("/rag search head 1", Mock(), console, None, None, rag) is True
+    preview = console.print.call_args[0][0].rsplit("\n    ", 1)[1]
+    assert preview == "short head..."
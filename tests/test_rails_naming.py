@@ -0,0 +1,16 @@
+from util.rails_naming import class_to_table_name, table_to_model
+
+
+def test_class_to_table_name_pluralizes_snake_case():
+    assert class_to_table_name("User") == "users"
+    assert class_to_table_name("UserProfile") == "user_profiles"
+    assert class_to_table_name("Category") == "categories"
+    assert class_to_table_name("Box") == "boxes"
+
+
+def test_table_to_model_singularizes_and_camelizes():
+    assert table_to_model("users") == "User"
+    assert table_to_model("categories") == "Category"
+    assert table_to_model("addresses") == "Address"
+    assert table_to_model("ORDER_ITEMS") == "OrderItem"
+    assert table_to_model("data") == "Data"
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import pytest
+
+from rag.rails_rag.indexer import RailsCodeIndexer
+
+# Minimal stand-in for ripgrep covering the invocations the indexer makes:
+# ``--files``, ``-l`` and ``--null --line-number``. Output is raw bytes, like rg.
+FAKE_RG = '''#!{python}
+import fnmatch, os, re, sys
+args = sys.argv[1:]
+root = args[-1]
+patterns = [re.compile(args[i + 1].encode()) for i, a in enumerate(args) if a == "-e"]
+glob = args[args.index("-g") + 1].encode()
+out = sys.stdout.buffer
+for dirpath, _, names in os.walk(os.fsencode(root)):
+    for name in sorted(names):
+        if not fnmatch.fnmatchcase(name, glob):
+            continue
+        path = os.path.join(dirpath, name)
+        if "--files" in args:
+            out.write(path + b"\\n")
+            continue
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+        hits = [(n, l) for n, l in enumerate(lines, 1) if any(p.search(l) for p in patterns)]
+        if hits and "-l" in args:
+            out.write(path + b"\\n")
+        elif hits:
+            for n, line in hits:
+                out.write(path + b"\\0" + str(n).encode() + b":" + line + b"\\n")
+'''
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake rg is a shebang script")
+
+
+@pytest.fixture
+def fake_rg(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    rg = bin_dir / "rg"
+    rg.write_text(FAKE_RG.format(python=sys.executable))
+    rg.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def _controllers_dir(root):
+    controllers = root / "app" / "controllers"
+    controllers.mkdir(parents=True)
+    return controllers
+
+
+def test_controller_index_survives_non_utf8_controller(tmp_path, fake_rg):
+    app = tmp_path / "app_root"
+    controllers = _controllers_dir(app)
+    (controllers / "cafe_controller.rb").write_bytes(
+        b"class CafeController < ApplicationController\n  def caf\xe9\n  end\nend\n"
+    )
+    (controllers / "posts_controller.rb").write_text(
+        "class PostsController < ApplicationController\n  def index\n  end\n\n  private\n\n  def helper\n  end\nend\n"
+    )
+
+    indexer = RailsCodeIndexer(str(app))
+    indexer.exclude_patterns = set()  # pytest's tmp_path lives under /tmp
+    controllers_index = indexer._index_controllers()
+
+    # The undecodable controller is reported and skipped; the rest is indexed
+    assert controllers_index == [
+        {"class_name": "PostsController", "file": "app/controllers/posts_controller.rb", "actions": ["index"]}
+    ]
+
+
+def test_rg_files_keeps_non_utf8_file_names(tmp_path, fake_rg):
+    controllers = _controllers_dir(tmp_path)
+    odd = controllers / os.fsdecode(b"caf\xe9_controller.rb")
+    odd.write_text("class CafeController\nend\n")
+
+    indexer = RailsCodeIndexer(str(tmp_path))
+
+    assert indexer._rg_files(controllers, "*.rb") == [odd]
+    assert indexer._rg_matching_files(controllers, [r"^\s*class\s"]) == {odd}
@@ -1,5 +1,24 @@
+import asyncio
+import io
 import os
-from util.simple_pt_input import _is_complete_at_command
+from types import SimpleNamespace
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from rich.console import Console
+
+import util.simple_pt_input as simple_pt_input
+from util.at_completer import AtCommandCompleter
+from util.simple_pt_input import (
+    InputResult,
+    _DebouncedAtCompleter,
+    _create_key_bindings,
+    _display_usage_instructions,
+    _history_state,
+    _is_complete_at_command,
+    _probe_readable_file,
+    _process_user_input,
+)
 
 
 def test_is_complete_at_command(tmp_path, monkeypatch):
@@ -19,3 +38,126 @@ def test_is_complete_at_command(tmp_path, monkeypatch):
     # Absolute path also works
     abs_file = tmp_path / "note.md"
     assert _is_complete_at_command(f"@{abs_file}", None) is True
+
+
+def test_is_complete_at_command_reuses_recent_probe(tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("x")
+    monkeypatch.chdir(tmp_path)
+    _probe_readable_file.cache_clear()
+
+    assert _is_complete_at_command("@./a.txt", None) is True
+    assert _is_complete_at_command("@./a.txt", None) is True
+    assert _probe_readable_file.cache_info().hits >= 1
+
+
+def _collect_async(completer, document, event):
+    async def run():
+        return [c async for c in completer.get_completions_async(document, event)]
+    return asyncio.run(run())
+
+
+def test_debounced_completer_skips_non_at_words_and_stale_documents(tmp_path, monkeypatch):
+    (tmp_path / "note.md").write_text("hi")
+    monkeypatch.chdir(tmp_path)
+
+    completer = _DebouncedAtCompleter(AtCommandCompleter(), delay=0)
+    typing = CompleteEvent(text_inserted=True)
+
+    # No '@' in the current word: nothing, and no filesystem work
+    assert _collect_async(completer, Document("hello no"), typing) == []
+
+    # Outside a running app the buffer never matches, so a typing-triggered
+    # run is treated as superseded
+    assert _collect_async(completer, Document("@no"), typing) == []
+
+    # Explicit (Tab) requests complete immediately
+    requested = CompleteEvent(completion_requested=True)
+    texts = [c.text for c in _collect_async(completer, Document("@no"), requested)]
+    assert texts == ["@note.md"]
+
+
+def test_key_bindings_are_reused_and_history_state_resets():
+    first = _create_key_bindings(["one"])
+    _history_state.position = 0
+    _history_state.original_text = "draft"
+
+    history = ["one", "two"]
+    second = _create_key_bindings(history)
+    assert second is first
+    assert _history_state.history is history
+    assert _history_state.position == 2
+    assert _history_state.original_text == ""
+
+    _create_key_bindings(None)
+    assert _history_state.history == []
+    assert _history_state.position == 0
+
+
+def test_process_user_input_returns_shared_noop_results():
+    console = Console(file=io.StringIO())
+
+    toggled = _process_user_input("/think", console, False, True)
+    assert toggled == InputResult(None, False, True, True)
+    assert _process_user_input("/think", console, False, True) is toggled
+
+    message = _process_user_input("  hello  ", console, True, False)
+    assert message == InputResult("hello", True, True, False)
+
+    assert _process_user_input("/tools", console, True, False) == InputResult(None, False, True, True)
+    assert _process_user_input(" /clear ", console, False, False) == InputResult("__CLEAR__", False, False, False)
+    assert _process_user_input("/think why", console, False, False) == InputResult("why", True, False, False)
+
+
+def test_usage_line_is_right_aligned():
+    out = io.StringIO()
+    console = Console(file=out, width=140)
+
+    _display_usage_instructions(console, "1k/200k", thinking_mode=True)
+    _display_usage_instructions(console, "1k/200k", thinking_mode=True)
+
+    first, second = out.getvalue().splitlines()
+    assert first == second
+    assert "/think reasoning [ON]" in first and "/tools functions    " in first
+    assert first.endswith("Tokens: 1k/200k") and len(first) == 136
+
+
+def test_live_completion_only_enabled_inside_at_word(monkeypatch):
+    def with_text(text):
+        buffer = SimpleNamespace(document=Document(text))
+        monkeypatch.setattr(simple_pt_input, "get_app", lambda: SimpleNamespace(current_buffer=buffer))
+        return simple_pt_input._typing_at_word()
+
+    assert with_text("plain chat text") is False
+    assert with_text("look at @src/ma") is True
+    assert with_text("@src/main.py and more") is False
+
+
+def test_get_multiline_input_classifies_raw_text(monkeypatch):
+    console = Console(file=io.StringIO())
+    monkeypatch.setattr(simple_pt_input, "_display_usage_instructions", lambda *args: None)
+
+    def submit(text):
+        monkeypatch.setattr(simple_pt_input, "_prompt_for_input", lambda *args: text)
+        return simple_pt_input.get_multiline_input(console)
+
+    assert submit("") is submit(" \n ")
+    assert submit(" \n ").text is None
+    assert submit("  @missing/file.py ").text == "__AT_COMMAND__@missing/file.py"
+    assert submit(" hello ").text == "hello"
+
+
+def test_history_navigation_restores_draft():
+    from prompt_toolkit.keys import Keys
+
+    bindings = _create_key_bindings(["first", "second"])
+    up = bindings.get_bindings_for_keys((Keys.Up,))[0].handler
+    down = bindings.get_bindings_for_keys((Keys.Down,))[0].handler
+    event = SimpleNamespace(current_buffer=SimpleNamespace(text="draft", cursor_position=5))
+
+    up(event)
+    assert (event.current_buffer.text, event.current_buffer.cursor_position) == ("second", 6)
+    up(event)
+    assert event.current_buffer.text == "first"
+    down(event)
+    down(event)
+    assert (event.current_buffer.text, event.current_buffer.cursor_position) == ("draft", 5)
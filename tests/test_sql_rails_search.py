@@ -0,0 +1,91 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+from agents.tools.sql_rails_search import SQLRailsSearchTool
+
+# Minimal stand-in for ripgrep: ``--version``, ``-i`` and ``-e`` patterns, with
+# rg's exit codes. ``\h`` (valid in rg, not in Python re) is translated, and any
+# other pattern Python cannot compile is rejected like rg's regex parse error.
+FAKE_RG = '''#!{python}
+import os, re, sys
+args = sys.argv[1:]
+if "--version" in args:
+    print("ripgrep 14.0.0")
+    sys.exit(0)
+flags = re.IGNORECASE if "-i" in args else 0
+try:
+    patterns = [re.compile(args[i + 1].replace("\\\\h", "[ \\\\t]"), flags) for i, a in enumerate(args) if a == "-e"]
+except re.error as e:
+    sys.stderr.write("regex parse error: %s\\n" % e)
+    sys.exit(2)
+found = False
+for dirpath, _, names in os.walk(args[-1]):
+    for name in sorted(names):
+        path = os.path.join(dirpath, name)
+        with open(path) as f:
+            for n, line in enumerate(f.read().splitlines(), 1):
+                if any(p.search(line) for p in patterns):
+                    print("%s:%d:%s" % (path, n, line))
+                    found = True
+sys.exit(0 if found else 1)
+'''
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake rg is a shebang script")
+
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    rg = bin_dir / "rg"
+    rg.write_text(FAKE_RG.format(python=sys.executable))
+    rg.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    models = tmp_path / "app" / "models"
+    models.mkdir(parents=True)
+    (models / "user.rb").write_text("class User < ApplicationRecord\n\tscope :active, -> { where(active: true) }\nend\n")
+    return SQLRailsSearchTool(project_root=str(tmp_path / "app"))
+
+
+def _search(tool, monkeypatch, patterns):
+    monkeypatch.setattr(tool, "_infer_patterns", lambda parsed: patterns)
+    return asyncio.run(tool.execute({"sql": "SELECT * FROM users WHERE active = 1"}))
+
+
+def test_rg_invalid_pattern_does_not_hide_other_hits(tool, monkeypatch):
+    result = _search(
+        tool,
+        monkeypatch,
+        [
+            {"label": "scope", "regex": r"scope\s+:active"},
+            {"label": "broken", "regex": r"where\((active"},
+        ],
+    )
+
+    scope, broken = result["patterns_tried"]
+    assert scope == {"pattern": "scope", "regex": r"scope\s+:active", "matches": 1}
+    assert broken["matches"] == 0
+    assert "regex parse error" in broken["error"]
+    assert [(r["file"], r["line"]) for r in result["results"]] == [("models/user.rb", 2)]
+
+
+def test_hits_python_cannot_attribute_are_counted(tool, monkeypatch):
+    result = _search(
+        tool,
+        monkeypatch,
+        [
+            {"label": "class", "regex": r"^class User\b"},
+            {"label": "tab scope", "regex": r"^\hscope"},
+        ],
+    )
+
+    klass, tab_scope = result["patterns_tried"]
+    assert klass["matches"] == 1
+    assert tab_scope["matches"] == 0 and "error" in tab_scope
+    assert result["total_results"] == 1
+    # rg matched the scope line, but no pattern claims it in Python's re dialect
+    assert result["unattributed_matches"] == 1
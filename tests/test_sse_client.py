@@ -3,6 +3,7 @@
 Test script for SSE client functionality via StreamingClient.
 """
 
+import socket
 import sys
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -19,16 +20,22 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from streaming_client import StreamingClient
 
 
+def _sse_body(lines, chunk_size=7):
+    """Encode SSE lines as a newline-separated body split into small byte chunks."""
+    body = "\n".join(lines).encode("utf-8")
+    return [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+
 def test_sse_lines_basic():
     """Test basic SSE line parsing."""
     # Mock response with SSE lines
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
+    mock_response.iter_content.return_value = _sse_body([
         "data: Hello world",
         "data: Second line",
         "",
         "data: Third line"
-    ]
+    ])
     mock_response.raise_for_status.return_value = None
     
     # Mock session
@@ -46,13 +53,13 @@ def test_sse_lines_basic():
 def test_sse_lines_data_prefix_stripping():
     """Test that 'data:' prefix is properly stripped."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
+    mock_response.iter_content.return_value = _sse_body([
         "data: Content with spaces",
         "data:No space after colon",
         "data:   Multiple spaces",
         "event: some-event",  # Non-data line
         "data: Final line"
-    ]
+    ])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -69,14 +76,14 @@ def test_sse_lines_data_prefix_stripping():
 def test_sse_lines_empty_line_filtering():
     """Test that empty lines are filtered out."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
+    mock_response.iter_content.return_value = _sse_body([
         "data: Line 1",
         "",
-        None,
+        "",
         "data: Line 2",
         "",
         "data: Line 3"
-    ]
+    ])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -93,7 +100,7 @@ def test_sse_lines_empty_line_filtering():
 def test_sse_lines_get_method():
     """Test SSE client with GET method."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = ["data: GET response"]
+    mock_response.iter_content.return_value = _sse_body(["data: GET response"])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -110,7 +117,7 @@ def test_sse_lines_get_method():
 def test_sse_lines_custom_timeout():
     """Test SSE client with custom timeout."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = ["data: Test"]
+    mock_response.iter_content.return_value = _sse_body(["data: Test"])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -132,7 +139,7 @@ def test_sse_lines_custom_timeout():
 def test_sse_lines_with_params():
     """Test SSE client with query parameters."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = ["data: Params test"]
+    mock_response.iter_content.return_value = _sse_body(["data: Params test"])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -152,14 +159,15 @@ def test_sse_lines_with_params():
     )
 
 
+@patch('streaming_client._DEFAULT_SESSION', None)
 @patch('streaming_client.requests.Session')
 def test_sse_lines_default_session(mock_session_class):
-    """Test SSE client creates default session when none provided."""
+    """Test SSE client creates one shared default session when none provided."""
     mock_session = Mock()
     mock_session_class.return_value = mock_session
     
     mock_response = Mock()
-    mock_response.iter_lines.return_value = ["data: Default session"]
+    mock_response.iter_content.return_value = _sse_body(["data: Default session"])
     mock_response.raise_for_status.return_value = None
     
     mock_session.post.return_value.__enter__ = Mock(return_value=mock_response)
@@ -167,8 +175,10 @@ def test_sse_lines_default_session(mock_session_class):
     
     client = StreamingClient()
     lines = list(client.iter_sse_lines("http://test.com", json={"test": True}))
+    list(client.iter_sse_lines("http://test.com", json={"test": True}))
     
     mock_session_class.assert_called_once()
+    assert mock_session.post.call_count == 2
     assert lines == ["Default session"]
 
 
@@ -192,7 +202,7 @@ def test_sse_lines_http_error():
 def test_sse_lines_json_payload():
     """Test SSE client with JSON payload."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = ["data: JSON test"]
+    mock_response.iter_content.return_value = _sse_body(["data: JSON test"])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -215,7 +225,7 @@ def test_sse_lines_json_payload():
 def test_sse_lines_mixed_content():
     """Test SSE client with mixed SSE content types."""
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
+    mock_response.iter_content.return_value = _sse_body([
         "event: message",
         "data: Event message",
         "id: 123",
@@ -223,7 +233,7 @@ def test_sse_lines_mixed_content():
         ": this is a comment",
         "data: Final message",
         ""
-    ]
+    ])
     mock_response.raise_for_status.return_value = None
     
     mock_session = Mock()
@@ -244,6 +254,86 @@ def test_sse_lines_mixed_content():
     assert lines == expected
 
 
+def test_sse_lines_chunk_boundaries():
+    """Test lines and multi-byte characters split across reads, with CRLF endings."""
+    body = "data: héllo wörld\r\n\r\ndata: {\"k\": 1}\r\n".encode("utf-8")
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [body[i:i + 1] for i in range(len(body))]
+    mock_response.raise_for_status.return_value = None
+
+    mock_session = Mock()
+    mock_session.post.return_value.__enter__ = Mock(return_value=mock_response)
+    mock_session.post.return_value.__exit__ = Mock(return_value=None)
+
+    client = StreamingClient()
+    lines = list(client.iter_sse_lines("http://test.com", session=mock_session))
+
+    assert lines == ["héllo wörld", '{"k": 1}']
+
+
+def _batch_response(chunks, fileno=None):
+    mock_response = Mock()
+    mock_response.iter_content.return_value = chunks
+    mock_response.raise_for_status.return_value = None
+    if fileno is None:
+        mock_response.raw.fileno.side_effect = OSError("no socket")
+    else:
+        mock_response.raw.fileno.return_value = fileno
+
+    mock_session = Mock()
+    mock_session.post.return_value.__enter__ = Mock(return_value=mock_response)
+    mock_session.post.return_value.__exit__ = Mock(return_value=None)
+    return mock_session
+
+
+def test_sse_lines_batched_per_read_without_socket():
+    """Test that batching falls back to one list per read when the socket can't be polled."""
+    chunks = [b"data: a\ndata: b\n", b"data: c\n", b"data: [DONE]\n"]
+    client = StreamingClient()
+    batches = list(client.iter_sse_lines("http://test.com", session=_batch_response(chunks), batch_ms=50))
+
+    assert batches == [["a", "b"], ["c"], ["[DONE]"]]
+
+
+def test_sse_lines_batched_until_done_while_data_pending():
+    """Test that reads are coalesced while more data is waiting, and [DONE] flushes."""
+    reader, writer = socket.socketpair()
+    try:
+        writer.send(b"x")  # Keep the polled socket readable
+        chunks = [b"data: a\n", b"data: b\n", b"data: [DONE]\n", b"data: tail\n"]
+        client = StreamingClient()
+        session = _batch_response(chunks, fileno=reader.fileno())
+        batches = list(client.iter_sse_lines("http://test.com", session=session, batch_ms=10_000))
+    finally:
+        reader.close()
+        writer.close()
+
+    assert batches == [["a", "b", "[DONE]"], ["tail"]]
+
+
+def test_sse_json_decodes_objects_and_skips_other_lines():
+    """Test iter_sse_json parses data payloads and drops non-JSON lines and [DONE]."""
+    mock_response = Mock()
+    mock_response.iter_content.return_value = _sse_body([
+        "event: message",
+        'data: {"type": "text", "text": "héllo"}',
+        ": keep-alive comment",
+        "data: 42",
+        'data:{"type": "stop"}',
+        "data: [DONE]",
+    ])
+    mock_response.raise_for_status.return_value = None
+
+    mock_session = Mock()
+    mock_session.post.return_value.__enter__ = Mock(return_value=mock_response)
+    mock_session.post.return_value.__exit__ = Mock(return_value=None)
+
+    client = StreamingClient()
+    objs = list(client.iter_sse_json("http://test.com", session=mock_session))
+
+    assert objs == [{"type": "text", "text": "héllo"}, {"type": "stop"}]
+
+
 if __name__ == "__main__":
     if pytest:
         pytest.main([__file__])
@@ -259,4 +349,7 @@ if __name__ == "__main__":
         test_sse_lines_http_error()
         test_sse_lines_json_payload()
         test_sse_lines_mixed_content()
+        test_sse_lines_chunk_boundaries()
+        test_sse_lines_batched_per_read_without_socket()
+        test_sse_json_decodes_objects_and_skips_other_lines()
         print("All SSE client tests passed!")
\ No newline at end of file
@@ -1,12 +1,42 @@
 """Live @ command autocomplete for file system navigation."""
 
+import heapq
 import os
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Iterable, Optional
+from typing import List, Iterable, Iterator, Optional
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
 
+def _is_dir(entry: os.DirEntry) -> bool:
+    """Return whether a directory entry is a directory, treating errors as files."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _iter_matches(scandir_it: Iterable[os.DirEntry], partial_name: str,
+                  show_hidden: bool) -> Iterator[os.DirEntry]:
+    """Yield directory entries matching the completion filter.
+
+    Args:
+        scandir_it: Iterator returned by ``os.scandir``
+        partial_name: Lower-cased name prefix to match (empty matches all)
+        show_hidden: Whether to include entries starting with '.'
+    """
+    for entry in scandir_it:
+        name = entry.name
+        # Skip hidden files unless explicitly requested
+        if not show_hidden and name.startswith('.'):
+            continue
+        # Filter by partial name if provided
+        if partial_name and not name.lower().startswith(partial_name):
+            continue
+        yield entry
+
+
 class AtCommandCompleter(Completer):
     """Autocompleter for @ commands that provides live file system navigation."""
 
@@ -30,47 +60,36 @@ class AtCommandCompleter(Completer):
         Returns:
             Iterator of Completion objects for file/directory suggestions
         """
-        # Get the text before cursor to check for @ commands
-        text_before_cursor = document.text_before_cursor
-
-        # Find the last @ character and extract the @ command
-        last_at_index = text_before_cursor.rfind('@')
+        # Only the word under the cursor can be an @ command (no spaces after the @),
+        # so isolate it with a single reverse scan and look for @ within it
+        current_word = document.text_before_cursor.rpartition(' ')[2]
+        last_at_index = current_word.rfind('@')
         if last_at_index == -1:
             return
 
-        # Extract the @ command from the last @ to cursor
-        at_command = text_before_cursor[last_at_index:]
-
-        # Only complete if this looks like an @ command (starts with @ and no spaces after)
-        if not at_command.startswith('@') or ' ' in at_command:
-            return
-
         # Extract the path part after @
-        at_path = at_command[1:]  # Remove @ prefix
+        at_path = current_word[last_at_index + 1:]
 
         try:
-            # Generate file/directory completions
-            completions = list(self._get_path_completions(at_path))
-
-            # Limit number of completions to avoid overwhelming UI
-            for completion in completions[:self.max_completions]:
-                yield completion
+            # Completions are already capped at max_completions
+            yield from self._get_path_completions(at_path)
 
         except Exception:
             # If anything fails, don't show completions rather than crash
             return
 
-    def _get_path_completions(self, at_path: str) -> List[Completion]:
+    def _get_path_completions(self, at_path: str) -> Iterator[Completion]:
         """Get file/directory completions for a given @ path.
 
+        Entries are filtered and ranked in a single ``os.scandir`` pass; only
+        the first ``max_completions`` matches (by name) are formatted.
+
         Args:
             at_path: Path part after @ symbol
 
         Returns:
-            List of Completion objects
+            Iterator of Completion objects
         """
-        completions = []
-
         # Determine the directory to search and partial filename
         if at_path == "":
             # Just @ - complete current directory
@@ -92,74 +111,47 @@ class AtCommandCompleter(Completer):
                 search_dir = os.getcwd()
                 partial_name = at_path.lower()
 
-        # Check if directory exists and is accessible
-        if not os.path.exists(search_dir) or not os.path.isdir(search_dir):
-            return completions
-
         try:
-            # Get directory entries
-            entries = os.listdir(search_dir)
-
-            for entry in sorted(entries):
-                entry_path = os.path.join(search_dir, entry)
-
-                # Skip hidden files unless explicitly requested
-                if entry.startswith('.') and not at_path.startswith('.'):
-                    continue
-
-                # Filter by partial name if provided
-                if partial_name and not entry.lower().startswith(partial_name):
-                    continue
-
-                # Check if it's a directory or file
-                is_dir = os.path.isdir(entry_path)
-
-                # Create completion text
-                if "/" in at_path and not at_path.endswith("/"):
-                    # Has directory path and partial filename - replace just the partial part
-                    dir_part = "/".join(at_path.split("/")[:-1]) + "/"
-                    if is_dir:
-                        completion_text = f"@{dir_part}{entry}/"
-                        display_text = f"{entry}/"
-                    else:
-                        completion_text = f"@{dir_part}{entry}"
-                        display_text = self._format_file_display(entry, entry_path)
-                    # Replace from the start of partial filename
-                    start_position = -len(at_path.split("/")[-1])
-                elif not "/" in at_path and at_path:
-                    # No directory, just partial filename in current dir
-                    if is_dir:
-                        completion_text = f"@{entry}/"
-                        display_text = f"{entry}/"
-                    else:
-                        completion_text = f"@{entry}"
-                        display_text = self._format_file_display(entry, entry_path)
-                    # Replace the whole @partial
-                    start_position = -len(at_path) - 1
-                else:
-                    # Default case
-                    if is_dir:
-                        completion_text = f"@{at_path}{entry}/"
-                        display_text = f"{entry}/"
-                    else:
-                        completion_text = f"@{at_path}{entry}"
-                        display_text = self._format_file_display(entry, entry_path)
-                    # Replace current @... word
-                    start_position = -len(at_path) - 1
-
-                completion = Completion(
-                    text=completion_text,
-                    start_position=start_position,
-                    display=display_text
+            with os.scandir(search_dir) as it:
+                top_k = heapq.nsmallest(
+                    self.max_completions,
+                    _iter_matches(it, partial_name, at_path.startswith('.')),
+                    key=attrgetter('name'),
                 )
-
-                completions.append(completion)
-
         except (PermissionError, OSError):
-            # Skip directories we can't read
-            pass
-
-        return completions
+            # Missing, non-directory or unreadable search dir
+            return iter(())
+
+        # Create completion text
+        if "/" in at_path and not at_path.endswith("/"):
+            # Has directory path and partial filename - replace just the partial part
+            prefix = at_path.rsplit("/", 1)[0] + "/"
+            # Replace from the start of partial filename
+            start_position = -len(at_path.rsplit("/", 1)[1])
+        elif "/" not in at_path and at_path:
+            # No directory, just partial filename in current dir
+            prefix = ""
+            # Replace the whole @partial
+            start_position = -len(at_path) - 1
+        else:
+            # Default case: replace current @... word
+            prefix = at_path
+            start_position = -len(at_path) - 1
+
+        def _format_completion(entry: os.DirEntry) -> Completion:
+            if _is_dir(entry):
+                completion_text = f"@{prefix}{entry.name}/"
+                display_text = f"{entry.name}/"
+            else:
+                completion_text = f"@{prefix}{entry.name}"
+                display_text = self._format_file_display(entry.name, entry.path)
+            return Completion(
+                text=completion_text,
+                start_position=start_position,
+                display=display_text
+            )
+
+        return map(_format_completion, top_k)
 
     def _resolve_path(self, at_path: str) -> str:
         """Resolve @ path to absolute filesystem path.
@@ -1,120 +1,180 @@
 """Command handling utilities for special commands."""
 
-from typing import Optional
-from context.context_manager import ContextManager
-from util.path_browser import PathBrowser
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # Only needed for annotations; callers construct and pass these objects
+    from context.context_manager import ContextManager
+    from util.path_browser import PathBrowser
+
+# Sentinels produced by util.simple_pt_input.get_multiline_input
+_CLEAR_SIGNAL = "__CLEAR__"
+_AT_PREFIX = "__AT_COMMAND__"
+
+# Characters of a RAG chunk inspected when building a search preview
+_PREVIEW_WINDOW = 200
+
+# Help markup is assembled once and emitted with a single console.print
+_HELP_TEXT = "\n".join([
+    "\n[bold cyan]Available Commands:[/bold cyan]",
+    "  [bold green]/help[/bold green]         - Show this help message",
+    "  [bold green]/clear[/bold green]        - Clear conversation history",
+    "  [bold green]/context[/bold green] <file> - Add file context to conversation",
+    "  [bold green]/context clear[/bold green] - Remove all file context",
+    "  [bold green]/context list[/bold green]  - Show active context files",
+    "  [bold green]/exit[/bold green]         - Quit the program",
+    "",
+    "[bold cyan]RAG Commands:[/bold cyan]",
+    "  [bold green]/rag index[/bold green] <type> <path> - Build index (type: naive)",
+    "  [bold green]/rag search[/bold green] <query> [k] - Preview top-k snippets",
+    "  [bold green]/rag on[/bold green] | /rag off - Toggle retrieval on submit",
+    "  [bold green]/rag status[/bold green]          - Show index status",
+    "  [bold green]/rag clear[/bold green]           - Remove saved index",
+    "",
+    "[bold cyan]Rails Code Analysis:[/bold cyan]",
+    "  [bold green]agents/ask_code.py[/bold green] --project <path> - Dedicated Rails analysis tool",
+    "  [dim]Example: python agents/ask_code.py --project /path/to/rails/app[/dim]",
+    "  [bold green]/tools[/bold green]          - Show agent tools and CLI availability",
+    "",
+    "[bold cyan]Session Commands:[/bold cyan]",
+    "  [bold green]/save[/bold green] [path]        - Save session JSON to file (default logs/sessions/<id>/session.json)",
+    "  [bold green]/export md[/bold green] [path]   - Export Markdown transcript (default logs/sessions/<id>/export.md)",
+    "  [bold green]/session status[/bold green]     - Show session id, totals, and folder",
+    "",
+    "[bold cyan]@ File Browser Commands:[/bold cyan]",
+    "  [bold yellow]@[/bold yellow]            - Start file path and use dropdown",
+    "  [bold yellow]@/path/[/bold yellow]      - Navigate into folder (dropdown)",
+    "  [bold yellow]@~/[/bold yellow]          - Browse home (dropdown)",
+    "  [bold yellow]@file.txt[/bold yellow]    - Add file to context",
+    "",
+    "[bold cyan]Keyboard Shortcuts:[/bold cyan]",
+    "  [bold yellow]Ctrl+J[/bold yellow]     - Insert new line (in multi-line input)",
+    "  [bold yellow]Enter[/bold yellow]      - Send message",
+    "  [bold yellow]Esc[/bold yellow]        - Abort current stream",
+    "  [bold yellow]Ctrl+C[/bold yellow]     - Quit program",
+    "",
+    "[bold cyan]Features:[/bold cyan]",
+    "  • Live Markdown rendering with syntax highlighting",
+    "  • Tool calling support (toggle with tools indicator)",
+    "  • Thinking mode support (toggle with thinking indicator)",
+    "  • File context injection for enhanced conversations",
+    "  • Interactive file browser with @ commands",
+    "  • Token usage and cost tracking",
+    "  • Input history navigation",
+    "",
+])
 
 
 def show_help_message(console) -> None:
-    """Display help message with all available commands."""
-    console.print("\n[bold cyan]Available Commands:[/bold cyan]")
-    console.print("  [bold green]/help[/bold green]         - Show this help message")
-    console.print("  [bold green]/clear[/bold green]        - Clear conversation history")
-    console.print("  [bold green]/context[/bold green] <file> - Add file context to conversation")
-    console.print("  [bold green]/context clear[/bold green] - Remove all file context")
-    console.print("  [bold green]/context list[/bold green]  - Show active context files")
-    console.print("  [bold green]/exit[/bold green]         - Quit the program")
-    console.print()
-    console.print("[bold cyan]RAG Commands:[/bold cyan]")
-    console.print("  [bold green]/rag index[/bold green] <type> <path> - Build index (type: naive)")
-    console.print("  [bold green]/rag search[/bold green] <query> [k] - Preview top-k snippets")
-    console.print("  [bold green]/rag on[/bold green] | /rag off - Toggle retrieval on submit")
-    console.print("  [bold green]/rag status[/bold green]          - Show index status")
-    console.print("  [bold green]/rag clear[/bold green]           - Remove saved index")
-    console.print()
-    console.print("[bold cyan]Rails Code Analysis:[/bold cyan]")
-    console.print("  [bold green]agents/ask_code.py[/bold green] --project <path> - Dedicated Rails analysis tool")
-    console.print("  [dim]Example: python agents/ask_code.py --project /path/to/rails/app[/dim]")
-    console.print("  [bold green]/tools[/bold green]          - Show agent tools and CLI availability")
-    console.print()
-    console.print("[bold cyan]Session Commands:[/bold cyan]")
-    console.print("  [bold green]/save[/bold green] [path]        - Save session JSON to file (default logs/sessions/<id>/session.json)")
-    console.print("  [bold green]/export md[/bold green] [path]   - Export Markdown transcript (default logs/sessions/<id>/export.md)")
-    console.print("  [bold green]/session status[/bold green]     - Show session id, totals, and folder")
-    console.print()
-    console.print("[bold cyan]@ File Browser Commands:[/bold cyan]")
-    console.print("  [bold yellow]@[/bold yellow]            - Start file path and use dropdown")
-    console.print("  [bold yellow]@/path/[/bold yellow]      - Navigate into folder (dropdown)")
-    console.print("  [bold yellow]@~/[/bold yellow]          - Browse home (dropdown)")
-    console.print("  [bold yellow]@file.txt[/bold yellow]    - Add file to context")
-    console.print()
-    console.print("[bold cyan]Keyboard Shortcuts:[/bold cyan]")
-    console.print("  [bold yellow]Ctrl+J[/bold yellow]     - Insert new line (in multi-line input)")
-    console.print("  [bold yellow]Enter[/bold yellow]      - Send message")
-    console.print("  [bold yellow]Esc[/bold yellow]        - Abort current stream")
-    console.print("  [bold yellow]Ctrl+C[/bold yellow]     - Quit program")
-    console.print()
-    console.print("[bold cyan]Features:[/bold cyan]")
-    console.print("  • Live Markdown rendering with syntax highlighting")
-    console.print("  • Tool calling support (toggle with tools indicator)")
-    console.print("  • Thinking mode support (toggle with thinking indicator)")
-    console.print("  • File context injection for enhanced conversations")
-    console.print("  • Interactive file browser with @ commands")
-    console.print("  • Token usage and cost tracking")
-    console.print("  • Input history navigation")
-    console.print()
+    """Display help message with all available commands (no-op without a console)."""
+    if console is None:
+        return
+    console.print(_HELP_TEXT)
 
 
-def handle_special_commands(user_input: Optional[str], conversation, console=None, context_manager: Optional[ContextManager] = None, path_browser: Optional[PathBrowser] = None, rag_manager=None, react_agent=None) -> bool:
-    """Handle special commands like /help, /clear, /context, @ and /exit. Returns True if command was handled."""
-    if user_input == "__CLEAR__":
-        conversation.clear_history()
-        return True
-    if user_input and user_input.strip().lower() == "/clear":
-        conversation.clear_history()
-        return True
-    if user_input and user_input.strip().lower() == "/help":
-        if console:
-            show_help_message(console)
-        return True
+def handle_tools_command(react_agent, console) -> bool:
+    """Show agent tools and external CLI availability."""
+    if console:
+        if not react_agent:
+            console.print("[red]Agent not available[/red]")
+            return True
+        try:
+            st = react_agent.get_status() if hasattr(react_agent, "get_status") else {}
+            tools = st.get("tools_available") or list(getattr(react_agent, "tools", {}).keys())
+            console.print(f"[cyan]Agent tools[/cyan] ({len(tools)}): {', '.join(sorted(tools)) if tools else 'none'}")
+        except Exception as e:
+            console.print(f"[yellow]Could not fetch agent tools[/yellow]: {e}")
 
-    # Show agent tools and external CLI availability
-    if user_input and user_input.strip().lower() == "/tools":
-        if console:
-            if not react_agent:
-                console.print("[red]Agent not available[/red]")
-                return True
-            try:
-                st = react_agent.get_status() if hasattr(react_agent, "get_status") else {}
-                tools = st.get("tools_available") or list(getattr(react_agent, "tools", {}).keys())
-                console.print(f"[cyan]Agent tools[/cyan] ({len(tools)}): {', '.join(sorted(tools)) if tools else 'none'}")
-            except Exception as e:
-                console.print(f"[yellow]Could not fetch agent tools[/yellow]: {e}")
+        # Quick binary availability check for popular CLIs
+        try:
+            import shutil
+            bins = {"rg": "ripgrep", "ast-grep": "ast-grep", "ctags": "universal-ctags"}
+            statuses = []
+            for b, label in bins.items():
+                ok = shutil.which(b) is not None
+                mark = "[green]✓[/green]" if ok else "[red]✗[/red]"
+                statuses.append(f"{mark} {label}")
+            console.print("[dim]CLI availability:[/dim] " + ", ".join(statuses))
+        except Exception:
+            pass
+    return True
 
-            # Quick binary availability check for popular CLIs
-            try:
-                import shutil
-                bins = {"rg": "ripgrep", "ast-grep": "ast-grep", "ctags": "universal-ctags"}
-                statuses = []
-                for b, label in bins.items():
-                    ok = shutil.which(b) is not None
-                    mark = "[green]✓[/green]" if ok else "[red]✗[/red]"
-                    statuses.append(f"{mark} {label}")
-                console.print("[dim]CLI availability:[/dim] " + ", ".join(statuses))
-            except Exception:
-                pass
-        return True
 
-    # Handle @ commands for file browsing
-    if user_input and user_input.startswith("__AT_COMMAND__"):
-        at_command = user_input[14:]  # Remove "__AT_COMMAND__" prefix
-        return handle_at_command(at_command, context_manager, path_browser, console)
+def _cmd_clear(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    conversation.clear_history()
+    return True
 
-    # Handle context commands
-    if user_input and user_input.strip().lower().startswith("/context"):
-        return handle_context_command(user_input.strip(), context_manager, console)
 
-    # Handle RAG commands
-    if user_input and user_input.strip().lower().startswith("/rag"):
-        return handle_rag_command(user_input.strip(), rag_manager, console)
+def _cmd_help(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    show_help_message(console)
+    return True
 
-    # Handle Rails agent commands
-    if user_input and user_input.strip().lower().startswith("/agent"):
-        return handle_agent_command(user_input.strip(), react_agent, console)
 
+def _cmd_tools(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    return handle_tools_command(react_agent, console)
+
+
+def _cmd_context(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    return handle_context_command(stripped, context_manager, console)
+
+
+def _cmd_rag(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    return handle_rag_command(stripped, rag_manager, console)
+
+
+def _cmd_agent(stripped, conversation, console, context_manager, rag_manager, react_agent) -> bool:
+    return handle_agent_command(stripped, react_agent, console)
+
+
+# Slash commands keyed on their lower-cased first word: (handler, accepts_arguments).
+# Commands that take no arguments are only handled when typed on their own.
+_COMMAND_TABLE = {
+    "/clear": (_cmd_clear, False),
+    "/help": (_cmd_help, False),
+    "/tools": (_cmd_tools, False),
+    "/context": (_cmd_context, True),
+    "/rag": (_cmd_rag, True),
+    "/agent": (_cmd_agent, True),
+}
+
+
+def handle_special_commands(user_input: Optional[str], conversation, console=None, context_manager: Optional[ContextManager] = None, path_browser: Optional[PathBrowser] = None, rag_manager=None, react_agent=None) -> bool:
+    """Handle special commands like /help, /clear, /context, @ and /exit. Returns True if command was handled."""
     if user_input is None:
         return True  # Command handled or empty input
-    return False
+    if user_input == _CLEAR_SIGNAL:
+        conversation.clear_history()
+        return True
+
+    # Handle @ commands for file browsing
+    if user_input.startswith(_AT_PREFIX):
+        return handle_at_command(user_input[len(_AT_PREFIX):], context_manager, path_browser, console)
+
+    stripped = user_input.strip()
+    if not stripped.startswith("/"):
+        return False
+
+    words = stripped.split(None, 1)
+    entry = _COMMAND_TABLE.get(words[0].lower())
+    if entry is None:
+        return False
+    handler, accepts_arguments = entry
+    if len(words) > 1 and not accepts_arguments:
+        return False
+    return handler(stripped, conversation, console, context_manager, rag_manager, react_agent)
+
+
+def _print_contexts(context_manager: ContextManager, console) -> None:
+    """Print the active context files in a single batched call."""
+    contexts = context_manager.list_contexts()
+    if not contexts:
+        console.print("[dim]No active context files[/dim]")
+        return
+    lines = [f"[green]Active context ({context_manager.get_status_summary()}):[/green]"]
+    lines.extend(f"  [cyan]{ctx['path']}[/cyan] ({ctx['size']}, added {ctx['timestamp']})" for ctx in contexts)
+    console.print("\n".join(lines))
 
 
 def handle_context_command(user_input: str, context_manager: Optional[ContextManager], console) -> bool:
@@ -133,21 +193,16 @@ def handle_context_command(user_input: str, context_manager: Optional[ContextMan
             console.print("[red]Context manager not available[/red]")
         return True
 
-    # Parse command parts
-    parts = user_input.split(None, 2)  # Split into max 3 parts: /context, subcommand, argument
+    # Split off "/context"; the remainder is either a subcommand or a file path
+    parts = user_input.split(None, 1)
 
     if len(parts) == 1:
         # Just "/context" - show status
-        contexts = context_manager.list_contexts()
-        if not contexts:
-            console.print("[dim]No active context files[/dim]")
-        else:
-            console.print(f"[green]Active context: {context_manager.get_status_summary()}[/green]")
-            for ctx in contexts:
-                console.print(f"  [cyan]{ctx['path']}[/cyan] ({ctx['size']}, added {ctx['timestamp']})")
+        _print_contexts(context_manager, console)
         return True
 
-    subcommand = parts[1].lower()
+    tail = parts[1]
+    subcommand = tail.partition(" ")[0].lower()
 
     if subcommand == "clear":
         # Clear all context
@@ -157,23 +212,19 @@ def handle_context_command(user_input: str, context_manager: Optional[ContextMan
 
     elif subcommand == "list":
         # List active contexts
-        contexts = context_manager.list_contexts()
-        if not contexts:
-            console.print("[dim]No active context files[/dim]")
-        else:
-            console.print(f"[green]Active context ({context_manager.get_status_summary()}):[/green]")
-            for ctx in contexts:
-                console.print(f"  [cyan]{ctx['path']}[/cyan] ({ctx['size']}, added {ctx['timestamp']})")
+        _print_contexts(context_manager, console)
         return True
 
     else:
         # Treat as file path (including cases where subcommand is actually a file path)
-        file_path = " ".join(parts[1:])  # Rejoin everything after "/context"
+        file_path = tail
 
         try:
             context_manager.add_file_context(file_path)
-            console.print(f"[green]Added context file: {file_path}[/green]")
-            console.print(f"[dim]Context status: {context_manager.get_status_summary()}[/dim]")
+            console.print(
+                f"[green]Added context file: {file_path}[/green]\n"
+                f"[dim]Context status: {context_manager.get_status_summary()}[/dim]"
+            )
         except FileNotFoundError:
             console.print(f"[red]File not found: {file_path}[/red]")
         except ValueError as e:
@@ -202,8 +253,8 @@ def handle_at_command(at_command: str, context_manager: Optional[ContextManager]
         return True
 
     try:
-        # Parse the @ command
-        path, is_directory_listing = path_browser.parse_at_command(at_command)
+        # Parse the @ command (resolving symlinks: this path is the one added to context)
+        path, is_directory_listing = path_browser.parse_at_command(at_command, resolve=True)
 
         if is_directory_listing:
             # Suppress printing listings; rely on @ dropdown navigation
@@ -225,8 +276,10 @@ def handle_at_command(at_command: str, context_manager: Optional[ContextManager]
             try:
                 context_manager.add_file_context(path)
                 display_path = path_browser.get_relative_path(path)
-                console.print(f"[green]Added context file: {display_path}[/green]")
-                console.print(f"[dim]Context status: {context_manager.get_status_summary()}[/dim]")
+                console.print(
+                    f"[green]Added context file: {display_path}[/green]\n"
+                    f"[dim]Context status: {context_manager.get_status_summary()}[/dim]"
+                )
             except ValueError as e:
                 console.print(f"[red]Error adding context: {e}[/red]")
             except Exception as e:
@@ -291,25 +344,29 @@ def handle_rag_command(user_input: str, rag_manager, console) -> bool:
         if len(parts) < 3:
             console.print("[yellow]Usage: /rag search <query> [k][/yellow]")
             return True
-        # Extract k if present (last token numeric)
-        k_val = rag_manager.default_k
-        try:
-            maybe_k = int(parts[-1])
+        # Extract k if present (last token numeric and following a query)
+        if len(parts) >= 4 and parts[-1].isdecimal():
+            k_val = int(parts[-1])
             query = " ".join(parts[2:-1])
-            k_val = maybe_k
-        except ValueError:
+        else:
+            k_val = rag_manager.default_k
             query = " ".join(parts[2:])
         results = rag_manager.search(query, k=k_val)
         if not results:
             console.print("[dim]No results[/dim]")
             return True
-        console.print(f"[cyan]Top {len(results)}[/cyan] for: {query}")
+        lines = [f"[cyan]Top {len(results)}[/cyan] for: {query}"]
         for i, r in enumerate(results, 1):
             src = f"{r.get('path','')}#{r.get('start',0)}-{r.get('end',0)}"
-            preview = (r.get("text") or "").strip().replace("\n", " ")
-            if len(preview) > 160:
+            # Only normalize a bounded head of the chunk; previews are at most 160 chars
+            text = r.get("text") or ""
+            preview = text[:_PREVIEW_WINDOW].strip() or text.strip()[:_PREVIEW_WINDOW]
+            preview = preview.replace("\n", " ")
+            # Mark truncation from the raw length; the stripped head can be short
+            if len(preview) > 160 or len(text) > _PREVIEW_WINDOW:
                 preview = preview[:157] + "..."
-            console.print(f" {i}. [dim]{src}[/dim]\n    {preview}")
+            lines.append(f" {i}. [dim]{src}[/dim]\n    {preview}")
+        console.print("\n".join(lines))
         return True
 
     console.print("[yellow]Unknown /rag command[/yellow]")
@@ -319,7 +376,9 @@ def handle_rag_command(user_input: str, rag_manager, console) -> bool:
 def handle_agent_command(user_input: str, react_agent, console) -> bool:
     """Handle /agent commands - now deprecated in favor of ask_code.py."""
     if console:
-        console.print("[yellow]/agent commands are no longer available in llm-cli[/yellow]")
-        console.print("[cyan]For Rails code analysis, use:[/cyan]")
-        console.print("[green]  python agents/ask_code.py --project /path/to/rails/app[/green]")
+        console.print(
+            "[yellow]/agent commands are no longer available in llm-cli[/yellow]\n"
+            "[cyan]For Rails code analysis, use:[/cyan]\n"
+            "[green]  python agents/ask_code.py --project /path/to/rails/app[/green]"
+        )
     return True
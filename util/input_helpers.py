@@ -1,9 +1,40 @@
 """Input handling utilities."""
 
+import os
 import sys
 from contextlib import contextmanager
 from typing import Optional
 
+try:
+    import select
+    import termios  # type: ignore
+    import tty  # type: ignore
+    _HAVE_TERMIOS = True
+except Exception:
+    # Unsupported platform (e.g. Windows); raw mode and ESC polling are disabled
+    _HAVE_TERMIOS = False
+
+
+def _isatty(file) -> bool:
+    try:
+        return file.isatty()
+    except Exception:
+        return False
+
+
+# TTY status of sys.stdin, cached for the stream object it was computed for
+_stdin_tty_cache = (sys.stdin, _isatty(sys.stdin))
+
+
+def _stdin_isatty() -> bool:
+    """Return whether sys.stdin is a TTY, re-checking only if sys.stdin was replaced."""
+    global _stdin_tty_cache
+    stdin, is_tty = _stdin_tty_cache
+    if stdin is not sys.stdin:
+        is_tty = _isatty(sys.stdin)
+        _stdin_tty_cache = (sys.stdin, is_tty)
+    return is_tty
+
 
 @contextmanager
 def _raw_mode(file):
@@ -11,20 +42,13 @@ def _raw_mode(file):
 
     No-ops on non-TTYs or platforms without termios/tty.
     """
-    try:
-        import termios  # type: ignore
-        import tty  # type: ignore
-    except Exception:
-        # Unsupported platform or import error; proceed without raw mode
+    # Skip raw mode for unsupported platforms and non-TTY files (pipes, redirects)
+    if not _HAVE_TERMIOS or not (_stdin_isatty() if file is sys.stdin else _isatty(file)):
         yield
         return
 
     old_attrs = None
     try:
-        # Skip raw mode for non-TTY files (pipes, redirects)
-        if not hasattr(file, "isatty") or not file.isatty():
-            yield
-            return
         fd = file.fileno()
         # Save current terminal attributes for restoration
         old_attrs = termios.tcgetattr(fd)
@@ -48,20 +72,15 @@ def _esc_pressed(timeout: float = 0.0) -> bool:
 
     Uses select+os.read in a non-blocking way; returns False on non-TTY or unsupported platforms.
     """
-    try:
-        import select
-        import os as _os
-    except Exception:
-        return False
     # Only works on TTY (not pipes/redirects)
-    if not hasattr(sys.stdin, "isatty") or not sys.stdin.isatty():
+    if not _HAVE_TERMIOS or not _stdin_isatty():
         return False
     try:
         # Check if stdin has data available within timeout
         rlist, _, _ = select.select([sys.stdin], [], [], timeout)
         if rlist:
             # Read single byte and check if it's ESC (0x1b)
-            ch = _os.read(sys.stdin.fileno(), 1)
+            ch = os.read(sys.stdin.fileno(), 1)
             return ch == b"\x1b"  # ESC
     except Exception:
         return False
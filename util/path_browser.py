@@ -1,9 +1,31 @@
 """File and directory browser for @ symbol commands."""
 
+import heapq
 import os
+import stat
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Container, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
+
+
+# Directory listings kept per PathBrowser (see list_directory)
+_DIR_CACHE_SIZE = 64
+
+_SIZE_UNITS = (("B", 1), ("K", 1 << 10), ("M", 1 << 20), ("G", 1 << 30))
+
+_USAGE_HINT_LINES = (
+    "",
+    "💡 Use @ commands:",
+    "  @filename.txt → add file to context",
+    "  @folder/ → browse folder",
+)
+
+
+def _name_lower(item: "PathItem") -> str:
+    """Sort key for case-insensitive name ordering."""
+    return item.name.lower()
 
 
 @dataclass
@@ -29,12 +51,19 @@ class PathBrowser:
         """
         self.show_hidden = show_hidden
         self.max_items = max_items
+        # LRU cache: (dir, mtime_ns, show_hidden, max_items) -> [(name, path)] of the listed entries
+        self._dir_cache: "OrderedDict[Tuple[str, int, bool, int], List[Tuple[str, str]]]" = OrderedDict()
     
-    def parse_at_command(self, command: str) -> Tuple[str, bool]:
+    def parse_at_command(self, command: str, resolve: bool = False) -> Tuple[str, bool]:
         """Parse @ command to extract path and determine if it's a file or directory.
         
+        By default the path is normalized lexically (no symlink resolution), which
+        is cheap enough for per-keystroke browsing. Pass ``resolve=True`` to get the
+        fully resolved path, e.g. before adding a file to context.
+        
         Args:
             command: Command starting with @
+            resolve: Resolve symlinks with ``Path.resolve()``
             
         Returns:
             Tuple of (resolved_path, is_directory_listing)
@@ -52,85 +81,92 @@ class PathBrowser:
         elif path_part.startswith("./"):
             path_part = os.path.abspath(path_part)
         
-        # Resolve path
-        try:
-            resolved_path = str(Path(path_part).resolve())
-        except Exception:
-            # If path resolution fails, return as-is
-            resolved_path = path_part
+        if resolve:
+            try:
+                resolved_path = str(Path(path_part).resolve())
+            except Exception:
+                # If path resolution fails, return as-is
+                resolved_path = path_part
+        else:
+            # Purely lexical: joins cwd and collapses '.', '..' and duplicate separators
+            resolved_path = os.path.abspath(path_part)
         
         # Check if path exists and determine type
-        if os.path.exists(resolved_path):
-            if os.path.isdir(resolved_path):
-                return resolved_path, True
-            else:
-                return resolved_path, False
-        else:
+        try:
+            st = os.stat(resolved_path)
+        except (OSError, ValueError):
             # Path doesn't exist - could be for directory listing or file addition
             # If it ends with / treat as directory, otherwise as file
             return resolved_path, path_part.endswith("/")
+        return resolved_path, stat.S_ISDIR(st.st_mode)
     
     def list_directory(self, directory_path: str) -> List[PathItem]:
         """List contents of a directory.
         
+        Which entries are listed is cached until the directory's mtime changes
+        (i.e. entries are added, removed or renamed); each entry is stat'ed
+        again on every call so sizes and permissions are current.
+        
         Args:
             directory_path: Path to directory to list
             
         Returns:
             List of PathItem objects representing directory contents
         """
-        if not os.path.exists(directory_path):
+        try:
+            st = os.stat(directory_path)
+        except OSError:
             raise FileNotFoundError(f"Directory not found: {directory_path}")
         
-        if not os.path.isdir(directory_path):
+        if not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Path is not a directory: {directory_path}")
         
+        key = (directory_path, st.st_mtime_ns, self.show_hidden, self.max_items)
+        entries = self._dir_cache.get(key)
+        if entries is not None:
+            self._dir_cache.move_to_end(key)
+        else:
+            entries = self._scan_directory(directory_path)
+            self._dir_cache[key] = entries
+            if len(self._dir_cache) > _DIR_CACHE_SIZE:
+                self._dir_cache.popitem(last=False)
+        
+        return [self._path_item(name, path) for name, path in entries]
+    
+    def _scan_directory(self, directory_path: str) -> List[Tuple[str, str]]:
+        """Return (name, path) of the first ``max_items`` visible entries by name.
+        
+        Uses a single ``os.scandir`` pass without stat'ing any entry.
+        """
         try:
-            items = []
-            entries = os.listdir(directory_path)
-            
-            for entry in sorted(entries):
-                entry_path = os.path.join(directory_path, entry)
-                
-                # Check if hidden
-                is_hidden = entry.startswith(".")
-                if is_hidden and not self.show_hidden:
-                    continue
-                
-                # Get item info
-                try:
-                    is_dir = os.path.isdir(entry_path)
-                    is_readable = os.access(entry_path, os.R_OK)
-                    
-                    # Get size for files
-                    size = None
-                    if not is_dir and is_readable:
-                        try:
-                            size = os.path.getsize(entry_path)
-                        except (OSError, PermissionError):
-                            size = None
-                    
-                    items.append(PathItem(
-                        name=entry,
-                        path=entry_path,
-                        is_dir=is_dir,
-                        size=size,
-                        is_readable=is_readable,
-                        is_hidden=is_hidden
-                    ))
-                    
-                except (OSError, PermissionError):
-                    # Skip items we can't access
-                    continue
-                
-                # Limit number of items
-                if len(items) >= self.max_items:
-                    break
-            
-            return items
-            
+            with os.scandir(directory_path) as it:
+                visible = (e for e in it if self.show_hidden or not e.name.startswith("."))
+                entries = heapq.nsmallest(self.max_items, visible, key=attrgetter("name"))
         except PermissionError:
             raise ValueError(f"Permission denied accessing directory: {directory_path}")
+        
+        return [(entry.name, entry.path) for entry in entries]
+    
+    def _path_item(self, name: str, path: str) -> PathItem:
+        """Build a PathItem from the entry's current stat."""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            st = None
+        is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+        is_readable = os.access(path, os.R_OK)
+        
+        # Get size for files
+        size = st.st_size if st is not None and not is_dir and is_readable else None
+        
+        return PathItem(
+            name=name,
+            path=path,
+            is_dir=is_dir,
+            size=size,
+            is_readable=is_readable,
+            is_hidden=name.startswith(".")
+        )
     
     def format_directory_listing(self, directory_path: str, items: List[PathItem], 
                                 context_manager=None, style: str = "icons") -> str:
@@ -156,22 +192,37 @@ class PathBrowser:
         else:
             return self._format_icon_style(directory_path, items, context_manager)
     
+    @staticmethod
+    def _split_items(items: List[PathItem]) -> Tuple[List[PathItem], List[PathItem]]:
+        """Partition items into (directories, files) in a single pass."""
+        directories: List[PathItem] = []
+        files: List[PathItem] = []
+        for item in items:
+            (directories if item.is_dir else files).append(item)
+        return directories, files
+    
+    @staticmethod
+    def _context_paths(context_manager) -> Container[str]:
+        """Return the set-like collection of paths currently in context."""
+        if context_manager is None:
+            return ()
+        return getattr(context_manager, "contexts", None) or ()
+    
     def _format_terminal_style(self, directory_path: str, items: List[PathItem], 
                               context_manager=None) -> str:
         """Format directory listing in terminal-style (like ls command)."""
-        lines = []
+        contexts = self._context_paths(context_manager)
         
         # Separate directories and files, sort by name
-        directories = sorted([item for item in items if item.is_dir], key=lambda x: x.name.lower())
-        files = sorted([item for item in items if not item.is_dir], key=lambda x: x.name.lower())
+        directories, files = self._split_items(items)
+        directories.sort(key=_name_lower)
+        files.sort(key=_name_lower)
+        
+        lines = []
         
         # Add directories first with trailing /
         for item in directories:
-            context_mark = ""
-            if context_manager and hasattr(context_manager, 'contexts'):
-                if item.path in context_manager.contexts:
-                    context_mark = " ✓"
-            
+            context_mark = " ✓" if item.path in contexts else ""
             if item.is_hidden:
                 lines.append(f".{item.name}/{context_mark}")
             else:
@@ -179,29 +230,22 @@ class PathBrowser:
         
         # Add files
         for item in files:
-            context_mark = ""
-            if context_manager and hasattr(context_manager, 'contexts'):
-                if item.path in context_manager.contexts:
-                    context_mark = " ✓"
-            
+            context_mark = " ✓" if item.path in contexts else ""
             lines.append(f"{item.name}{context_mark}")
         
         # Add usage hint at the end
-        lines.append("")
-        lines.append("💡 Use @ commands:")
-        lines.append("  @filename.txt → add file to context")
-        lines.append("  @folder/ → browse folder")
+        lines.extend(_USAGE_HINT_LINES)
         
         return "\n".join(lines)
     
     def _format_icon_style(self, directory_path: str, items: List[PathItem], 
                           context_manager=None) -> str:
         """Format directory listing with emoji icons (original style)."""
+        contexts = self._context_paths(context_manager)
         lines = [f"📁 {directory_path}"]
         
         # Separate directories and files
-        directories = [item for item in items if item.is_dir]
-        files = [item for item in items if not item.is_dir]
+        directories, files = self._split_items(items)
         
         # Add directories first
         for item in directories:
@@ -219,19 +263,12 @@ class PathBrowser:
                 size_info = f" ({self._format_file_size(item.size)})" if item.size is not None else ""
             
             # Check if file is in context
-            context_mark = ""
-            if context_manager and hasattr(context_manager, 'contexts'):
-                if item.path in context_manager.contexts:
-                    context_mark = " ✓"
-            
+            context_mark = " ✓" if item.path in contexts else ""
             hidden_mark = " (hidden)" if item.is_hidden else ""
             lines.append(f"  {icon} {item.name}{size_info}{context_mark}{hidden_mark}")
         
         # Add usage hint
-        lines.append("")
-        lines.append("💡 Use @ commands:")
-        lines.append("  @filename.txt → add file to context")
-        lines.append("  @folder/ → browse folder")
+        lines.extend(_USAGE_HINT_LINES)
         
         return "\n".join(lines)
     
@@ -247,14 +284,12 @@ class PathBrowser:
         if size_bytes is None:
             return "unknown"
         
-        if size_bytes < 1024:
+        # Each unit step is 10 bits, so bit_length picks the unit without a compare chain
+        idx = min(3, max(0, (size_bytes.bit_length() - 1) // 10))
+        if not idx:
             return f"{size_bytes}B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes/1024:.1f}K"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes/(1024*1024):.1f}M"
-        else:
-            return f"{size_bytes/(1024*1024*1024):.1f}G"
+        unit, divisor = _SIZE_UNITS[idx]
+        return f"{size_bytes/divisor:.1f}{unit}"
     
     def validate_file_for_context(self, file_path: str) -> Tuple[bool, str]:
         """Validate if a file can be added to context.
@@ -265,22 +300,31 @@ class PathBrowser:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return False, f"File not found: {file_path}"
         
-        if not os.path.isfile(file_path):
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {file_path}"
         
         if not os.access(file_path, os.R_OK):
             return False, f"File is not readable: {file_path}"
         
-        # Check if it's likely a text file
+        # Check if it's likely a text file by decoding the first 1024 bytes
+        probe_size = 1024
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Try to read first 1024 bytes
-                f.read(1024)
-        except UnicodeDecodeError:
-            return False, f"File is not valid UTF-8 text: {file_path}"
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                chunk = os.read(fd, probe_size)
+            finally:
+                os.close(fd)
+            chunk.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off by the 1024-byte window is still valid
+            # text; a shorter read ended at the real end of file, so it is truncated
+            if e.reason != "unexpected end of data" or len(chunk) < probe_size:
+                return False, f"File is not valid UTF-8 text: {file_path}"
         except Exception as e:
             return False, f"Error reading file: {e}"
         
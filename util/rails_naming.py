@@ -0,0 +1,38 @@
+"""Rails naming conventions shared by the indexer, ctags client and SQL tools."""
+
+import functools
+import re
+
+_UPPER_RE = re.compile(r'([A-Z])')
+
+
+@functools.lru_cache(maxsize=1024)
+def class_to_table_name(class_name: str) -> str:
+    """Convert a model class name to its table name (``UserProfile`` -> ``user_profiles``)."""
+    # Simple pluralization (could use inflection library)
+    snake_case = _UPPER_RE.sub(r'_\1', class_name).lower().lstrip('_')
+
+    if snake_case.endswith('y'):
+        return snake_case[:-1] + 'ies'
+    elif snake_case.endswith(('s', 'sh', 'ch', 'x', 'z')):
+        return snake_case + 'es'
+    else:
+        return snake_case + 's'
+
+
+@functools.lru_cache(maxsize=1024)
+def table_to_model(table: str) -> str:
+    """Convert a table name to its model class name (``user_profiles`` -> ``UserProfile``)."""
+    # Basic singularization and capitalization
+    table = table.lower()
+    if table.endswith("ies"):
+        singular = table[:-3] + "y"
+    elif table.endswith("es"):
+        # Covers both "-ses" (addresses -> address) and other "-es" plurals
+        singular = table[:-2]
+    elif table.endswith("s"):
+        singular = table[:-1]
+    else:
+        singular = table
+
+    return "".join(word.capitalize() for word in singular.split("_"))
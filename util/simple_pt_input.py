@@ -17,14 +17,20 @@ Key Features:
 """
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import functools
+import os
+import time
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Iterable, NamedTuple, Optional
 
 from prompt_toolkit import prompt
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.filters import Condition
 from prompt_toolkit.application.current import get_app
 from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.completion import merge_completers
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion, merge_completers
+from prompt_toolkit.document import Document
 from prompt_toolkit.styles import Style
 from rich.console import Console
 from util.at_completer import AtCommandCompleter
@@ -32,6 +38,122 @@ from util.at_completer import AtCommandCompleter
 # Constants for visual consistency
 CURSOR_CHARACTER = "▌"
 
+# Prompt shown on every line, and the completion menu theme; built once at
+# import rather than on every prompt
+_PROMPT_HTML = HTML(f'<lemonchiffon>{CURSOR_CHARACTER}</lemonchiffon> ')
+
+# Simple, minimal completion menu theme to match main UI
+_MINIMAL_STYLE = Style.from_dict({
+    # Completion menu colors
+    "completion-menu": "bg:#2b2b2b #e5e5e5",
+    "completion-menu.completion": "bg:#2b2b2b #e5e5e5",
+    "completion-menu.completion.current": "bg:#3a3a3a #ffffff",
+    # Scrollbar
+    "scrollbar.background": "bg:#2b2b2b",
+    "scrollbar.button": "bg:#555555",
+})
+
+# Pause in typing before @ completion touches the filesystem
+COMPLETION_DEBOUNCE_SECONDS = 0.1
+
+# How long an @path "is it a readable file" answer may be reused
+_PROBE_TTL_SECONDS = 2.0
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_readable_file(cwd: str, file_path: str, ttl_window: int) -> bool:
+    """Resolve an @ path against cwd and check it is a readable file.
+
+    ``ttl_window`` is the current _PROBE_TTL_SECONDS time bucket; it is only
+    part of the cache key, giving entries an implicit expiry.
+    """
+    # Resolve path
+    if file_path.startswith('~/'):
+        resolved_path = os.path.expanduser(file_path)
+    elif file_path.startswith('./'):
+        resolved_path = os.path.normpath(os.path.join(cwd, file_path))
+    elif os.path.isabs(file_path):
+        resolved_path = file_path
+    else:
+        resolved_path = os.path.join(cwd, file_path)
+
+    # Check if it's a readable file; isfile() already answers False for
+    # missing paths and embedded NULs, so only access() needs guarding
+    if not os.path.isfile(resolved_path):
+        return False
+    try:
+        return os.access(resolved_path, os.R_OK)
+    except (OSError, ValueError):
+        return False
+
+
+class _DebouncedAtCompleter(Completer):
+    """
+    Wrap the @ completer so live completion doesn't stat on every keystroke.
+
+    Words without '@' are rejected up front. While typing, each completion
+    run first waits COMPLETION_DEBOUNCE_SECONDS and gives up if the buffer
+    changed meanwhile; prompt-toolkit then retries with the newer text, so
+    only the last keystroke of a burst reaches the filesystem. Explicit
+    requests (Tab) complete immediately.
+    """
+
+    def __init__(self, completer: Completer, delay: float = COMPLETION_DEBOUNCE_SECONDS):
+        self._completer = completer
+        self._delay = delay
+
+    @staticmethod
+    def _has_at_word(document: Document) -> bool:
+        return '@' in document.text_before_cursor.rpartition(' ')[2]
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent) -> Iterable[Completion]:
+        if self._has_at_word(document):
+            yield from self._completer.get_completions(document, complete_event)
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        if not self._has_at_word(document):
+            return
+
+        if not complete_event.completion_requested:
+            await asyncio.sleep(self._delay)
+            try:
+                if get_app().current_buffer.document != document:
+                    return  # Superseded by a newer keystroke
+            except Exception:
+                pass
+
+        for completion in self._completer.get_completions(document, complete_event):
+            yield completion
+
+
+@Condition
+def _typing_at_word() -> bool:
+    """Whether the word before the cursor is an @ command; gates live completion."""
+    return _DebouncedAtCompleter._has_at_word(get_app().current_buffer.document)
+
+
+class InputResult(NamedTuple):
+    """Outcome of one prompt turn."""
+    text: Optional[str]  # None means nothing to send; may be a __EXIT__/__CLEAR__/__AT_COMMAND__ sentinel
+    use_thinking: bool
+    thinking_mode: bool
+    tools_enabled: bool
+
+
+# Turns that produce nothing to send only carry the mode flags, so share one instance per combination
+_NOOP_RESULTS = {
+    (thinking, tools): InputResult(None, False, thinking, tools)
+    for thinking in (False, True)
+    for tools in (False, True)
+}
+
+
+def _noop_result(thinking_mode: bool, tools_enabled: bool) -> InputResult:
+    """Return the shared "nothing to send" result for the given mode flags."""
+    return _NOOP_RESULTS[(bool(thinking_mode), bool(tools_enabled))]
+
 
 def get_multiline_input(
     console: Console,
@@ -42,7 +164,7 @@ def get_multiline_input(
     tools_enabled: bool = False,
     agent_enabled: bool = False,
     context_manager=None
-) -> tuple[Optional[str], bool, bool, bool]:
+) -> InputResult:
     """
     Get multi-line input from user with enhanced prompt-toolkit interface.
 
@@ -65,7 +187,7 @@ def get_multiline_input(
         context_manager: Optional context manager for @ command autocompletion
 
     Returns:
-        tuple[Optional[str], bool, bool, bool]: (user_input, use_thinking, new_thinking_mode, new_tools_enabled)
+        InputResult: (text, use_thinking, thinking_mode, tools_enabled) after this turn
 
     Raises:
         No exceptions are raised - all errors are caught and handled gracefully
@@ -76,7 +198,7 @@ def get_multiline_input(
         >>> if user_input:
         ...     print(f"User entered: {user_input}")
     """
-    key_bindings = _create_key_bindings(history or [])
+    key_bindings = _create_key_bindings(history)
 
     # Show instructions with token info before prompting
     _display_usage_instructions(console, token_info, thinking_mode, tools_enabled, agent_enabled)
@@ -84,41 +206,49 @@ def get_multiline_input(
     try:
         user_input = _prompt_for_input(key_bindings, history, context_manager)
 
-        # Check for empty input immediately to avoid any visual artifacts
-        # But allow @ commands through (including just "@")
-        if not user_input:
-            return None, False, thinking_mode, tools_enabled
+        # Check for empty or whitespace-only input immediately to avoid any visual
+        # artifacts; isspace() answers this without building a stripped copy
+        if not user_input or user_input.isspace():
+            return _noop_result(thinking_mode, tools_enabled)
 
-        stripped_input = user_input.strip()
-        # Allow @ commands through, even if just "@"
-        if stripped_input.startswith('@'):
+        # Allow @ commands through, even if just "@" (only these need the stripped
+        # text here; _process_user_input strips everything else itself)
+        if user_input[0] == '@' or (user_input[0].isspace() and user_input.lstrip()[0] == '@'):
+            stripped_input = user_input.strip()
             # Check if this is a complete file path (from autocomplete selection)
             if _is_complete_at_command(stripped_input, context_manager):
                 # Automatically add file to context and return empty to continue input
                 _handle_at_selection(stripped_input, context_manager, console)
-                return None, False, thinking_mode, tools_enabled
+                return _noop_result(thinking_mode, tools_enabled)
             else:
                 # Process as regular @ command (for manual entry or incomplete paths)
-                return _process_user_input(user_input, console, thinking_mode, tools_enabled)
-
-        # Check for other empty input
-        if not stripped_input:
-            return None, False, thinking_mode, tools_enabled
+                return InputResult(f"__AT_COMMAND__{stripped_input}", False, thinking_mode, tools_enabled)  # Special @ command signal
 
         return _process_user_input(user_input, console, thinking_mode, tools_enabled)
 
     except (KeyboardInterrupt, EOFError):
         _display_cancellation_message(console)
-        return "__EXIT__", False, thinking_mode, tools_enabled  # Special exit signal
+        return InputResult("__EXIT__", False, thinking_mode, tools_enabled)  # Special exit signal
+
+
+@dataclass
+class _HistoryState:
+    """Up/down history navigation state shared by the cached key bindings."""
+    history: list[str] = field(default_factory=list)
+    position: int = 0  # len(history) means "no entry selected"
+    original_text: str = ""  # Text being edited before navigation started
+
+
+_history_state = _HistoryState()
+_key_bindings_cache: Optional[KeyBindings] = None
 
 
 def _create_key_bindings(history: list[str] = None) -> KeyBindings:
     """
-    Create and configure key bindings for the input interface.
+    Return the key bindings for the input interface, set up for a new prompt.
 
-    Sets up custom key combinations to override prompt-toolkit's default
-    multiline behavior, allowing us to control when input is submitted
-    versus when new lines are added. Also includes history navigation.
+    The bindings are built once and reused across turns; each call only
+    resets the shared history navigation state to ``history``.
 
     Args:
         history: List of previous user inputs for up/down arrow navigation
@@ -126,14 +256,35 @@ def _create_key_bindings(history: list[str] = None) -> KeyBindings:
     Returns:
         KeyBindings: Configured key bindings object for prompt-toolkit
     """
-    bindings = KeyBindings()
+    global _key_bindings_cache
 
-    # History navigation state
     if history is None:
         history = []
 
-    history_position = len(history)  # Start at end (no selection)
-    original_text = ""  # Store original text when navigating
+    _history_state.history = history
+    _history_state.position = len(history)  # Start at end (no selection)
+    _history_state.original_text = ""
+
+    if _key_bindings_cache is None:
+        _key_bindings_cache = _build_key_bindings(_history_state)
+    return _key_bindings_cache
+
+
+def _build_key_bindings(state: _HistoryState) -> KeyBindings:
+    """
+    Create and configure key bindings for the input interface.
+
+    Sets up custom key combinations to override prompt-toolkit's default
+    multiline behavior, allowing us to control when input is submitted
+    versus when new lines are added. Also includes history navigation.
+
+    Args:
+        state: History navigation state, read and updated by the up/down handlers
+
+    Returns:
+        KeyBindings: Configured key bindings object for prompt-toolkit
+    """
+    bindings = KeyBindings()
 
     # Completion menu filters
     @Condition
@@ -152,9 +303,9 @@ def _create_key_bindings(history: list[str] = None) -> KeyBindings:
     @bindings.add('enter', eager=True, filter=completion_menu_active)
     def handle_enter_accept_completion(event):
         buf = event.current_buffer
-        state = buf.complete_state
-        if state and state.current_completion:
-            comp = state.current_completion
+        complete_state = buf.complete_state
+        if complete_state and complete_state.current_completion:
+            comp = complete_state.current_completion
             buf.apply_completion(comp)
             # If the accepted text ends with '/', keep browsing
             try:
@@ -195,40 +346,41 @@ def _create_key_bindings(history: list[str] = None) -> KeyBindings:
     @bindings.add('up', filter=completion_menu_inactive)
     def handle_up_arrow_history(event):
         """Handle Up arrow key press - navigate to previous history item."""
-        nonlocal history_position, original_text
-
+        history = state.history
         if not history:
             return  # No history to navigate
 
         # Save original text when first navigating
-        if history_position == len(history):
-            original_text = event.current_buffer.text
+        if state.position == len(history):
+            state.original_text = event.current_buffer.text
 
         # Move up in history (towards older entries)
-        if history_position > 0:
-            history_position -= 1
-            event.current_buffer.text = history[history_position]
-            event.current_buffer.cursor_position = len(history[history_position])
+        if state.position > 0:
+            state.position -= 1
+            entry = history[state.position]
+            buffer = event.current_buffer
+            buffer.text = entry
+            buffer.cursor_position = len(entry)
 
     @bindings.add('down', filter=completion_menu_inactive)
     def handle_down_arrow_history(event):
         """Handle Down arrow key press - navigate to next history item."""
-        nonlocal history_position, original_text
-
+        history = state.history
         if not history:
             return  # No history to navigate
 
         # Move down in history (towards newer entries)
-        if history_position < len(history):
-            history_position += 1
+        if state.position < len(history):
+            state.position += 1
 
-            if history_position == len(history):
+            if state.position == len(history):
                 # Back to original/empty text
-                event.current_buffer.text = original_text
-                event.current_buffer.cursor_position = len(original_text)
+                entry = state.original_text
             else:
-                event.current_buffer.text = history[history_position]
-                event.current_buffer.cursor_position = len(history[history_position])
+                entry = history[state.position]
+            buffer = event.current_buffer
+            buffer.text = entry
+            buffer.cursor_position = len(entry)
 
 
     return bindings
@@ -246,24 +398,6 @@ def _display_usage_instructions(console: Console, token_info: Optional[str] = No
         agent_enabled: Whether ReAct agent mode is currently enabled (deprecated, ignored)
         show_instructions: Whether to show the usage instructions
     """
-    # Build instructions with status indicators
-    base_instructions = "↵ send    Ctrl+J newline"
-
-    # Add thinking mode status
-    if thinking_mode:
-        thinking_part = "/think reasoning [ON]"
-    else:
-        thinking_part = "/think reasoning"
-
-    # Add tools mode status
-    if tools_enabled:
-        tools_part = "/tools functions [ON]"
-    else:
-        tools_part = "/tools functions"
-
-    # Agent mode is deprecated - no longer shown
-    instructions = f"{base_instructions}    {thinking_part}    {tools_part}    Esc/Ctrl+C=cancel"
-
     # Only show instructions if requested
     if not show_instructions:
         # Show only token info if available
@@ -271,6 +405,8 @@ def _display_usage_instructions(console: Console, token_info: Optional[str] = No
             console.print(f"[dim]Tokens: {token_info}[/dim]")
         return
 
+    instructions = _INSTRUCTIONS[(bool(thinking_mode), bool(tools_enabled))]
+
     if token_info:
         # Calculate padding to right-align token info
         terminal_width = console.size.width
@@ -290,32 +426,52 @@ def _display_usage_instructions(console: Console, token_info: Optional[str] = No
     console.print(f"[dim]{full_line}[/dim]")
 
 
-def _create_prompt_functions():
-    """
-    Create prompt functions for consistent cursor display.
+def _build_instructions(thinking_mode: bool, tools_enabled: bool) -> str:
+    """Build the key binding instructions with status indicators."""
+    base_instructions = "↵ send    Ctrl+J newline"
 
-    Returns:
-        tuple: (main_prompt_function, continuation_prompt_function)
-    """
-    def get_main_prompt():
-        """Return the main prompt string with cursor character."""
-        return HTML(f'<lemonchiffon>{CURSOR_CHARACTER}</lemonchiffon> ')
+    # Add thinking mode status
+    if thinking_mode:
+        thinking_part = "/think reasoning [ON]"
+    else:
+        thinking_part = "/think reasoning"
+
+    # Add tools mode status
+    if tools_enabled:
+        tools_part = "/tools functions [ON]"
+    else:
+        tools_part = "/tools functions"
+
+    # Agent mode is deprecated - no longer shown
+    return f"{base_instructions}    {thinking_part}    {tools_part}    Esc/Ctrl+C=cancel"
 
-    def get_continuation_prompt(width, line_number, is_soft_wrap):
-        """
-        Return the continuation prompt for multi-line input.
 
-        Args:
-            width: Terminal width (unused but required by prompt-toolkit)
-            line_number: Current line number (unused but required)
-            is_soft_wrap: Whether this is a soft wrap (unused but required)
+# Instructions text per (thinking_mode, tools_enabled)
+_INSTRUCTIONS = {
+    (thinking, tools): _build_instructions(thinking, tools)
+    for thinking in (False, True)
+    for tools in (False, True)
+}
 
-        Returns:
-            str: Same cursor character for visual consistency
-        """
-        return HTML(f'<lemonchiffon>{CURSOR_CHARACTER}</lemonchiffon> ')
 
-    return get_main_prompt, get_continuation_prompt
+def _get_main_prompt():
+    """Return the main prompt string with cursor character."""
+    return _PROMPT_HTML
+
+
+def _get_continuation_prompt(width, line_number, is_soft_wrap):
+    """
+    Return the continuation prompt for multi-line input.
+
+    Args:
+        width: Terminal width (unused but required by prompt-toolkit)
+        line_number: Current line number (unused but required)
+        is_soft_wrap: Whether this is a soft wrap (unused but required)
+
+    Returns:
+        HTML: Same cursor character for visual consistency
+    """
+    return _PROMPT_HTML
 
 
 def _prompt_for_input(key_bindings: KeyBindings, history: list[str] = None, context_manager=None) -> str:
@@ -330,40 +486,61 @@ def _prompt_for_input(key_bindings: KeyBindings, history: list[str] = None, cont
     Returns:
         str: Raw user input from prompt-toolkit
     """
-    main_prompt, continuation_prompt = _create_prompt_functions()
-
     # Create @ command completer if context manager is available
     completer = None
     if context_manager:
-        completer = AtCommandCompleter(context_manager=context_manager)
-
-    # Simple, minimal completion menu theme to match main UI
-    minimal_style = Style.from_dict({
-        # Completion menu colors
-        "completion-menu": "bg:#2b2b2b #e5e5e5",
-        "completion-menu.completion": "bg:#2b2b2b #e5e5e5",
-        "completion-menu.completion.current": "bg:#3a3a3a #ffffff",
-        # Scrollbar
-        "scrollbar.background": "bg:#2b2b2b",
-        "scrollbar.button": "bg:#555555",
-    })
+        completer = _DebouncedAtCompleter(AtCommandCompleter(context_manager=context_manager))
 
     return prompt(
-        main_prompt,
+        _get_main_prompt,
         key_bindings=key_bindings,
         multiline=True,
         wrap_lines=True,
-        prompt_continuation=continuation_prompt,
+        prompt_continuation=_get_continuation_prompt,
         completer=completer,
-        complete_while_typing=True,  # Enable live completion
-        style=minimal_style,
+        complete_while_typing=_typing_at_word,  # Live completion only while typing an @ word
+        style=_MINIMAL_STYLE,
     )
 
 
-def _process_user_input(user_input: str, console: Console, thinking_mode: bool, tools_enabled: bool) -> tuple[Optional[str], bool, bool, bool]:
+def _handle_think_toggle(console: Console, thinking_mode: bool, tools_enabled: bool) -> InputResult:
+    """Handle /think: toggle thinking mode."""
+    if thinking_mode:
+        console.print("[dim]Thinking mode disabled.[/dim]")
+    else:
+        console.print("[green]Thinking mode enabled. All messages will now show reasoning.[/green]")
+    return _noop_result(not thinking_mode, tools_enabled)
+
+
+def _handle_tools_toggle(console: Console, thinking_mode: bool, tools_enabled: bool) -> InputResult:
+    """Handle /tools: toggle tools mode."""
+    if tools_enabled:
+        console.print("[dim]Tools disabled. Claude will not use function calls.[/dim]")
+    else:
+        console.print("[green]Tools enabled. Claude can now use time tool.[/green]")
+    return _noop_result(thinking_mode, not tools_enabled)
+
+
+def _handle_clear(console: Console, thinking_mode: bool, tools_enabled: bool) -> InputResult:
+    """Handle /clear: signal the caller to drop chat history."""
+    console.print("[green]Chat history cleared.[/green]")
+    return InputResult("__CLEAR__", False, thinking_mode, tools_enabled)  # Special clear signal
+
+
+# Commands matched on the whole (stripped) input
+_EXACT_COMMANDS = {
+    '/think': _handle_think_toggle,
+    '/tools': _handle_tools_toggle,
+    '/clear': _handle_clear,
+}
+
+
+def _process_user_input(user_input: str, console: Console, thinking_mode: bool, tools_enabled: bool) -> InputResult:
     """
     Process the raw user input and handle special commands.
 
+    @ commands are dispatched by the caller before this is reached.
+
     Args:
         user_input: Raw input string from prompt-toolkit
         console: Rich console instance for any needed output
@@ -371,51 +548,33 @@ def _process_user_input(user_input: str, console: Console, thinking_mode: bool,
         tools_enabled: Current tools mode state
 
     Returns:
-        tuple[Optional[str], bool, bool, bool]: (processed_input, use_thinking, new_thinking_mode, new_tools_enabled)
+        InputResult: (text, use_thinking, thinking_mode, tools_enabled) after this command
     """
     # Input is guaranteed to be non-empty by caller
     cleaned_input = user_input.strip()
 
-    # Handle @ commands for file browsing - these need special processing
-    if cleaned_input.startswith('@'):
-        return f"__AT_COMMAND__{cleaned_input}", False, thinking_mode, tools_enabled  # Special @ command signal
-
-    # Handle thinking mode toggle command
-    if cleaned_input == '/think':
-        if thinking_mode:
-            console.print("[dim]Thinking mode disabled.[/dim]")
-        else:
-            console.print("[green]Thinking mode enabled. All messages will now show reasoning.[/green]")
-        return None, False, not thinking_mode, tools_enabled  # Toggle thinking mode
-
-    # Handle tools mode toggle command
-    elif cleaned_input == '/tools':
-        if tools_enabled:
-            console.print("[dim]Tools disabled. Claude will not use function calls.[/dim]")
-        else:
-            console.print("[green]Tools enabled. Claude can now use time tool.[/green]")
-        return None, False, thinking_mode, not tools_enabled  # Toggle tools mode
-
-    # Handle clear command
-    elif cleaned_input == '/clear':
-        console.print("[green]Chat history cleared.[/green]")
-        return "__CLEAR__", False, thinking_mode, tools_enabled  # Special clear signal
-
-    # Handle legacy /think <message> format for backward compatibility
-    elif cleaned_input.startswith('/think '):
-        actual_message = cleaned_input[7:].strip()  # Remove "/think " prefix
-        if actual_message:
-            console.print("[dim]Tip: Use /think to toggle thinking mode on/off, then just type your message.[/dim]")
-            return actual_message, True, thinking_mode, tools_enabled
-        else:
-            console.print("[yellow]Use /think to toggle thinking mode on/off, or /think <message> for one-time thinking.[/yellow]")
-            return None, False, thinking_mode, tools_enabled
+    # Only slash commands need dispatching; one first-character check lets
+    # regular messages skip the command lookups entirely
+    if cleaned_input[:1] == '/':
+        handler = _EXACT_COMMANDS.get(cleaned_input)
+        if handler is not None:
+            return handler(console, thinking_mode, tools_enabled)
+
+        # Handle legacy /think <message> format for backward compatibility
+        if cleaned_input.startswith('/think '):
+            actual_message = cleaned_input[7:].strip()  # Remove "/think " prefix
+            if actual_message:
+                console.print("[dim]Tip: Use /think to toggle thinking mode on/off, then just type your message.[/dim]")
+                return InputResult(actual_message, True, thinking_mode, tools_enabled)
+            else:
+                console.print("[yellow]Use /think to toggle thinking mode on/off, or /think <message> for one-time thinking.[/yellow]")
+                return _noop_result(thinking_mode, tools_enabled)
 
     # Regular message - use current thinking mode
     if cleaned_input:
-        return cleaned_input, thinking_mode, thinking_mode, tools_enabled
+        return InputResult(cleaned_input, thinking_mode, thinking_mode, tools_enabled)
     else:
-        return None, False, thinking_mode, tools_enabled
+        return _noop_result(thinking_mode, tools_enabled)
 
 
 def _is_complete_at_command(at_command: str, context_manager) -> bool:
@@ -437,23 +596,13 @@ def _is_complete_at_command(at_command: str, context_manager) -> bool:
     if not file_path or file_path.endswith('/'):
         return False
 
-    # Check if it's a valid file path
-    import os
+    # Check if it's a valid file path (probes are cached briefly, since the
+    # same path is re-checked while browsing down to it)
     try:
-        # Resolve path
-        if file_path.startswith('~/'):
-            resolved_path = os.path.expanduser(file_path)
-        elif file_path.startswith('./'):
-            resolved_path = os.path.abspath(file_path)
-        elif os.path.isabs(file_path):
-            resolved_path = file_path
-        else:
-            resolved_path = os.path.join(os.getcwd(), file_path)
-
-        # Check if it's a readable file
-        return os.path.isfile(resolved_path) and os.access(resolved_path, os.R_OK)
-    except:
+        cwd = os.getcwd()
+    except OSError:
         return False
+    return _probe_readable_file(cwd, file_path, int(time.monotonic() // _PROBE_TTL_SECONDS))
 
 
 def _handle_at_selection(at_command: str, context_manager, console: Console) -> None:
@@ -473,13 +622,16 @@ def _handle_at_selection(at_command: str, context_manager, console: Console) ->
         # Add file to context
         context_manager.add_file_context(file_path)
 
-        # Get relative path for display
-        import os
-        try:
-            rel_path = os.path.relpath(file_path)
-            display_path = rel_path if len(rel_path) < len(file_path) else file_path
-        except ValueError:
-            display_path = file_path
+        # Get relative path for display; paths from the completer are usually
+        # relative already, so only absolute ones are worth shortening
+        display_path = file_path
+        if os.path.isabs(file_path):
+            try:
+                rel_path = os.path.relpath(file_path)
+                if len(rel_path) < len(file_path):
+                    display_path = rel_path
+            except ValueError:
+                pass
 
         console.print(f"[green]Added context file: {display_path}[/green]")
         console.print(f"[dim]Context status: {context_manager.get_status_summary()}[/dim]")
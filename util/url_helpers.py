@@ -11,6 +11,22 @@ def to_mock_url(u: str) -> str:
       http://host:8000 -> http://host:8000/mock
       http://host:8000/anything -> http://host:8000/anything/mock
     """
+    # Fast path for plain http(s) URLs, which is all this is normally given;
+    # anything urlparse would reshape (query, fragment, params, stray
+    # whitespace, other schemes) goes through the general code below
+    if (u.startswith(("http://", "https://")) and u.isprintable() and " " not in u
+            and "?" not in u and "#" not in u and ";" not in u):
+        host_start = u.index("//") + 2
+        path_start = u.find("/", host_start)
+        if path_start < 0:
+            return u + "/mock"  # Bare authority, no path
+        if path_start > host_start:
+            if u.endswith("/mock"):
+                return u
+            if u.endswith("/invoke"):
+                return u[:-7] + "/mock"
+            return u + ("mock" if u.endswith("/") else "/mock")
+
     p = urlparse(u)
     path = p.path or "/"
     # Handle existing /mock endpoints